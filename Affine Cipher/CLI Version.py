@@ -1,6 +1,14 @@
 import sys
 import string
 import math # Needed for the GCD check in key validation
+import re
+import os
+import json
+import time
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache
+from collections import Counter
 
 # --- 📚 AFFINE CIPHER LOGIC AND CONSTANTS ---
 
@@ -13,6 +21,15 @@ MOD_INVERSE = {
     1: 1, 3: 9, 5: 21, 7: 15, 9: 3, 11: 19, 15: 7, 17: 23, 19: 11, 21: 5, 23: 17, 25: 25
 }
 
+# Standard English letter frequencies (percent), used by the ciphertext-only attack
+EN_FREQ = {
+    'a': 8.167, 'b': 1.492, 'c': 2.782, 'd': 4.253, 'e': 12.702,
+    'f': 2.228, 'g': 2.015, 'h': 6.094, 'i': 6.966, 'j': 0.153,
+    'k': 0.772, 'l': 4.025, 'm': 2.406, 'n': 6.749, 'o': 7.507,
+    'p': 1.929, 'q': 0.095, 'r': 5.987, 's': 6.327, 't': 9.056,
+    'u': 2.758, 'v': 0.978, 'w': 2.360, 'x': 0.150, 'y': 1.974, 'z': 0.074
+}
+
 def get_char_index(char):
     """Converts an alphabetic character (A-Z or a-z) to its 0-25 index."""
     char = char.upper()
@@ -62,12 +79,72 @@ def affine_transform_char(char, a, b, mode='encrypt'):
 
 # --- Core Cipher Logic ---
 
+# Number of compiled keys kept by compile_affine_key (batch jobs reuse only a few)
+AFFINE_KEY_CACHE_SIZE = 32
+
+class AffineTable(dict):
+    """
+    A str.translate table for one key and direction. ASCII letters are compiled up
+    front; any other code point is resolved through affine_transform_char on first
+    sight and cached, so every character behaves exactly as it does per character.
+    """
+    def __init__(self, a, b, mode):
+        super().__init__()
+        self.a, self.b, self.mode = a, b, mode
+        for char in string.ascii_letters:
+            self[ord(char)] = affine_transform_char(char, a, b, mode)
+
+    def __missing__(self, code_point):
+        result = affine_transform_char(chr(code_point), self.a, self.b, self.mode)
+        self[code_point] = result
+        return result
+
+class AffineKey:
+    """
+    A validated (a, b) key with precomputed encryption and decryption tables,
+    so processing text is a single str.translate call with no per-character dispatch.
+    """
+    def __init__(self, a, b):
+        if a not in MOD_INVERSE:
+            raise ValueError(f"Key 'a' ({a}) is invalid (gcd(a, 26) != 1).")
+        self.a = a
+        self.b = b % ALPHABET_SIZE
+        self.a_inv = MOD_INVERSE[a]
+        self.encrypt_table = AffineTable(self.a, self.b, 'encrypt')
+        self.decrypt_table = AffineTable(self.a, self.b, 'decrypt')
+
+    def encrypt(self, plaintext):
+        """Encrypts text with this key."""
+        return plaintext.translate(self.encrypt_table)
+
+    def decrypt(self, ciphertext):
+        """Decrypts text with this key."""
+        return ciphertext.translate(self.decrypt_table)
+
+    def process(self, text, mode='encrypt'):
+        """Encrypts or decrypts text depending on 'mode'."""
+        if mode == 'encrypt':
+            return self.encrypt(text)
+        if mode == 'decrypt':
+            return self.decrypt(text)
+        raise ValueError("Invalid mode: must be 'encrypt' or 'decrypt'.")
+
+    def bytes_table(self, mode='encrypt'):
+        """A bytes.translate table for 'mode'; only ASCII letters are remapped."""
+        letters = string.ascii_letters
+        return bytes.maketrans(letters.encode('ascii'), self.process(letters, mode).encode('ascii'))
+
+@lru_cache(maxsize=AFFINE_KEY_CACHE_SIZE)
+def compile_affine_key(a, b):
+    """Returns the compiled AffineKey for (a, b), reusing recently compiled keys."""
+    return AffineKey(a, b % ALPHABET_SIZE)
+
 def affine_process_text(text, a, b, mode='encrypt'):
     """
     Encrypts or decrypts text using the Affine Cipher with keys (a, b).
     """
     
-    return ''.join(affine_transform_char(char, a, b, mode) for char in text)
+    return compile_affine_key(a, b).process(text, mode)
 
 def affine_encrypt(plaintext, a, b):
     """Encrypts plaintext using the Affine Cipher."""
@@ -81,6 +158,135 @@ def affine_decrypt(ciphertext, a, b):
         
     return affine_process_text(ciphertext, a, b, mode='decrypt')
 
+# --- Cryptanalysis Logic ---
+
+PREVIEW_LENGTH = 60 # Characters decrypted for each ranked key
+
+def count_letters(text):
+    """Counts 'a'-'z' case-insensitively in one pass; returns the 26 counts and their total."""
+    counts = Counter(text)
+    letter_counts = [counts.get(lo, 0) + counts.get(up, 0)
+                     for lo, up in zip(string.ascii_lowercase, string.ascii_uppercase)]
+    return letter_counts, sum(letter_counts)
+
+def score_affine_keys(letter_counts, total_letters, freq_table=EN_FREQ):
+    """
+    Normalized Chi-squared score of all 312 keys against English, computed from the
+    ciphertext counts alone. Key (a, b) encrypts plaintext letter p to (a*p + b) mod 26,
+    so the plaintext count of p is the ciphertext count at that index: each key is
+    just a permutation of the count vector and nothing has to be decrypted.
+    Returns (a, b, score) tuples sorted by score (best first).
+    """
+    if not total_letters:
+        return [(a, b, float('inf')) for a in MOD_INVERSE for b in range(ALPHABET_SIZE)]
+
+    expected = [freq_table[ch] * total_letters / 100.0 for ch in string.ascii_lowercase]
+    scores = []
+    for a in MOD_INVERSE:
+        for b in range(ALPHABET_SIZE):
+            score = sum((letter_counts[(a * p + b) % ALPHABET_SIZE] - expected_count) ** 2 / expected_count
+                        for p, expected_count in enumerate(expected))
+            scores.append((a, b, score / total_letters))
+
+    scores.sort(key=lambda x: x[2])
+    return scores
+
+def affine_crack(ciphertext, top_k=5, preview_length=PREVIEW_LENGTH):
+    """
+    Ciphertext-only attack over the full 312-key space. Letters are counted once;
+    only the 'top_k' best keys decrypt a preview. Returns (a, b, score, preview) tuples.
+    Without any letters every key scores inf, so the ranking carries no information.
+    """
+    letter_counts, total_letters = count_letters(ciphertext)
+    preview_source = ciphertext[:preview_length]
+    return [(a, b, score, affine_decrypt(preview_source, a, b))
+            for a, b, score in score_affine_keys(letter_counts, total_letters)[:top_k]]
+
+def solve_affine_key(p1, c1, p2, c2):
+    """
+    Solves the system c1 = a*p1 + b, c2 = a*p2 + b (mod 26) for every valid key.
+    All arguments are 0-25 indices. Returns the list of (a, b) solutions, which
+    has exactly one entry when p1 - p2 is invertible mod 26.
+    """
+    solutions = []
+    for a in MOD_INVERSE:
+        b = (c1 - a * p1) % ALPHABET_SIZE
+        if (a * p2 + b) % ALPHABET_SIZE == c2:
+            solutions.append((a, b))
+    return solutions
+
+def affine_crib_scan(ciphertext, crib):
+    """
+    Known-plaintext attack: slides the crib over every offset of the letters-only
+    ciphertext and keeps the offsets consistent with exactly one valid key.
+
+    A pivot pair of crib positions (preferably with an invertible letter difference)
+    is chosen once, and a 26x26 difference table maps the two ciphertext letters at
+    those positions straight to the candidate keys. Each offset then costs one table
+    lookup plus one string comparison against the crib encrypted with that key.
+    Returns (text_offset, a, b) tuples, where text_offset indexes 'ciphertext'.
+    """
+    crib_letters = re.sub('[^A-Za-z]', '', crib).upper()
+    if len(crib_letters) < 2:
+        raise ValueError("The crib must contain at least two letters.")
+    crib_indices = [ord(ch) - ord('A') for ch in crib_letters]
+    p0 = crib_indices[0]
+
+    # Pivot: an invertible difference gives a unique key; any distinct letter narrows it down
+    differences = [(p - p0) % ALPHABET_SIZE for p in crib_indices]
+    pivot = next((k for k, d in enumerate(differences) if math.gcd(d, ALPHABET_SIZE) == 1),
+                 next((k for k, d in enumerate(differences) if d), 0))
+    p_pivot = crib_indices[pivot]
+
+    # Difference table: (first ciphertext letter, pivot ciphertext letter) -> candidate
+    # keys, each paired with the crib as that key would encrypt it
+    key_table = [[((a, b), ''.join(string.ascii_uppercase[(a * p + b) % ALPHABET_SIZE] for p in crib_indices))
+                  for a, b in solve_affine_key(p0, c0, p_pivot, ck)]
+                 for c0 in range(ALPHABET_SIZE) for ck in range(ALPHABET_SIZE)]
+
+    letters = re.sub('[^A-Za-z]', '', ciphertext).upper()
+    # Letter indices as a bytes object, so indexing yields small ints without a Python loop
+    codes = letters.encode('ascii').translate(bytes.maketrans(string.ascii_uppercase.encode('ascii'),
+                                                              bytes(range(ALPHABET_SIZE))))
+    crib_length = len(crib_letters)
+    offsets = len(codes) - crib_length + 1
+
+    matches = []
+    for i, (c0, ck) in enumerate(zip(codes[:offsets], codes[pivot:pivot + offsets])):
+        candidates = key_table[c0 * ALPHABET_SIZE + ck]
+        if not candidates:
+            continue
+        consistent = None
+        for key, encrypted_crib in candidates:
+            if letters.startswith(encrypted_crib, i):
+                if consistent is not None:
+                    break # A second consistent key makes this offset ambiguous
+                consistent = key
+        else:
+            if consistent is not None:
+                matches.append((i, *consistent))
+
+    # Translate letter offsets back to positions in the original ciphertext,
+    # walking runs of letters rather than single letters
+    if matches:
+        positions = []
+        letters_seen = 0
+        pending = iter(matches)
+        i, a, b = next(pending)
+        for run in re.finditer('[A-Za-z]+', ciphertext):
+            run_length = run.end() - run.start()
+            while i < letters_seen + run_length:
+                positions.append((run.start() + i - letters_seen, a, b))
+                i, a, b = next(pending, (None, None, None))
+                if i is None:
+                    break
+            if i is None:
+                break
+            letters_seen += run_length
+        matches = positions
+
+    return matches
+
 # --- Helper Functions (Key/Input Validation) ---
 
 def get_valid_keys():
@@ -144,6 +350,55 @@ def run_decryption_mode():
         print(f"\n  Error: {e}\n")
 
 
+def run_frequency_attack_mode():
+    """Handles the user interaction for the ciphertext-only (frequency analysis) attack."""
+    print("\n--- FREQUENCY ATTACK MODE (All 312 Keys) ---")
+    ciphertext = input("  Enter Ciphertext to Crack: ")
+
+    ranked = affine_crack(ciphertext)
+    if ranked[0][2] == float('inf'):
+        print("\n  The ciphertext contains no letters, so there is nothing to analyze.\n")
+        return
+
+    print(f"\n--- MOST LIKELY KEYS (Chi-Squared vs English, first {PREVIEW_LENGTH} characters) ---")
+    print("  Rank | Key (a, b) | Score    | Plaintext Preview")
+    for rank, (a, b, score, preview) in enumerate(ranked, 1):
+        print(f"  {rank:^4} | ({a:2}, {b:2})   | {score:8.4f} | {preview}")
+
+    a, b, score, _ = ranked[0]
+    print("\n--- BEST PREDICTION ---")
+    print(f"  Key (a, b): ({a}, {b})")
+    print(f"  Decrypted:  {affine_decrypt(ciphertext, a, b)}\n")
+
+def run_known_plaintext_mode():
+    """Handles the user interaction for the known-plaintext (crib scanning) attack."""
+    print("\n--- KNOWN-PLAINTEXT ATTACK MODE (Crib Scan) ---")
+    ciphertext = input("  Enter Ciphertext to Crack: ")
+    crib = input("  Enter a Crib (word expected in the plaintext): ")
+
+    try:
+        matches = affine_crib_scan(ciphertext, crib)
+    except ValueError as e:
+        print(f"\n  Error: {e}\n")
+        return
+
+    if not matches:
+        print("\n  No offset is consistent with a single valid key. Try another crib.\n")
+        return
+
+    # Several offsets may agree on the same key; the most common key is the best guess
+    key_votes = Counter((a, b) for _, a, b in matches)
+    print(f"\n--- CONSISTENT OFFSETS ({len(matches)} found) ---")
+    for (a, b), votes in key_votes.most_common(5):
+        offsets = [offset for offset, ka, kb in matches if (ka, kb) == (a, b)]
+        shown = ', '.join(map(str, offsets[:10])) + (', ...' if len(offsets) > 10 else '')
+        print(f"  Key (a, b): ({a:2}, {b:2})  at offsets: {shown}")
+
+    (a, b), _ = key_votes.most_common(1)[0]
+    print("\n--- BEST PREDICTION ---")
+    print(f"  Key (a, b): ({a}, {b})")
+    print(f"  Decrypted:  {affine_decrypt(ciphertext, a, b)}\n")
+
 def run_cryptanalysis_note():
     """Provides a note on Affine cryptanalysis."""
     print("\n--- CRYPTANALYSIS NOTE ---")
@@ -155,6 +410,109 @@ def run_cryptanalysis_note():
     print("  2. **Frequency Analysis**: The most frequent letter in the ciphertext is assumed to correspond to 'E' (or 'T'), and the second most frequent is assumed to correspond to 'T' (or 'A'). This provides two pairs to solve the linear equations.")
     print("-" * 60)
 
+# --- Batch Mode (Many Files, Process Pool) ---
+
+BATCH_CHUNK_SIZE = 1 << 20 # Bytes read per chunk, so each worker's memory stays bounded
+BATCH_OUTPUT_SUFFIX = {'encrypt': '.enc', 'decrypt': '.dec'}
+
+def load_batch_manifest(manifest_path):
+    """
+    Reads a JSONL manifest with one {"path", "a", "b", "mode"} job per line.
+    Relative paths are resolved against the manifest's directory. Keys must be
+    JSON integers and the mode 'encrypt' (default) or 'decrypt'.
+    """
+    base_dir = os.path.dirname(os.path.abspath(manifest_path))
+    jobs = []
+    with open(manifest_path, encoding='utf-8') as f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                job = json.loads(line)
+                for key in ('a', 'b'):
+                    if not isinstance(job[key], int) or isinstance(job[key], bool):
+                        raise ValueError(f"key '{key}' must be an integer, got {job[key]!r}")
+                mode = job.get('mode', 'encrypt')
+                if mode not in ('encrypt', 'decrypt'):
+                    raise ValueError(f"mode must be 'encrypt' or 'decrypt', got {mode!r}")
+                jobs.append({
+                    'path': os.path.join(base_dir, job['path']),
+                    'a': job['a'],
+                    'b': job['b'],
+                    'mode': mode,
+                })
+            except (ValueError, KeyError, TypeError) as e:
+                raise ValueError(f"Manifest line {line_number} is not a valid job: {e}") from None
+    return jobs
+
+def run_batch_job(job):
+    """
+    Encrypts or decrypts one file chunk by chunk, writing '<path>.enc' or '<path>.dec'
+    next to it. Runs inside a worker process. Returns a result dict with timing.
+    """
+    result = {'path': job['path'], 'output': None, 'bytes': 0, 'seconds': 0.0, 'error': None}
+    start = time.perf_counter()
+    try:
+        if job['mode'] not in BATCH_OUTPUT_SUFFIX:
+            raise ValueError("Invalid mode: must be 'encrypt' or 'decrypt'.")
+        table = compile_affine_key(job['a'], job['b']).bytes_table(job['mode'])
+        result['output'] = job['path'] + BATCH_OUTPUT_SUFFIX[job['mode']]
+
+        with open(job['path'], 'rb') as source, open(result['output'], 'wb') as sink:
+            while True:
+                chunk = source.read(BATCH_CHUNK_SIZE)
+                if not chunk:
+                    break
+                sink.write(chunk.translate(table))
+                result['bytes'] += len(chunk)
+    except (OSError, ValueError) as e:
+        result['error'] = str(e)
+    result['seconds'] = time.perf_counter() - start
+    return result
+
+def run_batch(jobs, workers=None):
+    """Fans the jobs out across a process pool; yields each result as it completes."""
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(run_batch_job, job) for job in jobs]
+        for future in as_completed(futures):
+            yield future.result()
+
+def run_batch_mode(argv):
+    """Non-interactive entry point: processes every job of a JSONL manifest in parallel."""
+    parser = argparse.ArgumentParser(description="Affine Cipher batch mode: apply per-file keys from a JSONL manifest.")
+    parser.add_argument('command', choices=['batch'])
+    parser.add_argument('manifest', help='JSONL file with one {"path", "a", "b", "mode"} job per line')
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help="Worker processes (default: all cores)")
+    args = parser.parse_args(argv)
+
+    if args.workers < 1:
+        parser.error("--workers must be a positive integer")
+    try:
+        jobs = load_batch_manifest(args.manifest)
+    except (OSError, ValueError) as e:
+        parser.error(str(e))
+
+    print(f"--- AFFINE BATCH: {len(jobs)} jobs on {args.workers} workers ---")
+    start = time.perf_counter()
+    total_bytes = 0
+    failed = 0
+    for result in run_batch(jobs, args.workers):
+        if result['error']:
+            failed += 1
+            print(f"  FAILED  {result['path']}: {result['error']}")
+            continue
+        total_bytes += result['bytes']
+        rate = result['bytes'] / result['seconds'] / 1e6 if result['seconds'] > 0 else float('inf')
+        print(f"  OK      {result['path']} -> {result['output']} "
+              f"({result['bytes'] / 1e6:.2f} MB in {result['seconds']:.3f}s, {rate:.2f} MB/s)")
+    elapsed = time.perf_counter() - start
+
+    throughput = total_bytes / elapsed / 1e6 if elapsed > 0 else float('inf')
+    print(f"\n  {len(jobs) - failed} succeeded, {failed} failed. "
+          f"Processed {total_bytes / 1e6:.2f} MB in {elapsed:.3f}s ({throughput:.2f} MB/s aggregate)")
+    if failed:
+        sys.exit(1)
+
 # --- Main Program Loop ---
 
 def main_menu():
@@ -165,26 +523,36 @@ def main_menu():
         print("=" * 60)
         print("  1. Encrypt Message")
         print("  2. Decrypt Message (Requires Keys a, b)")
-        print("  3. Cryptanalysis Note")
-        print("  4. Exit")
+        print("  3. Frequency Attack (Crack All 312 Keys)")
+        print("  4. Known-Plaintext Attack (Crib Scan)")
+        print("  5. Cryptanalysis Note")
+        print("  6. Exit")
         print("-" * 60)
         
-        choice = input("  Select an option (1-4): ")
+        choice = input("  Select an option (1-6): ")
         
         if choice == '1':
             run_encryption_mode()
         elif choice == '2':
             run_decryption_mode()
         elif choice == '3':
-            run_cryptanalysis_note()
+            run_frequency_attack_mode()
         elif choice == '4':
+            run_known_plaintext_mode()
+        elif choice == '5':
+            run_cryptanalysis_note()
+        elif choice == '6':
             print("\nExiting the program. Goodbye! 👋")
             sys.exit(0)
         else:
-            print("\n  Invalid choice. Please select an option between 1 and 4.")
+            print("\n  Invalid choice. Please select an option between 1 and 6.")
             
         print("=" * 60)
 
 # Standard Python idiom to run the main function
 if __name__ == '__main__':
-    main_menu()
\ No newline at end of file
+    # Command-line arguments select the non-interactive batch mode
+    if len(sys.argv) > 1:
+        run_batch_mode(sys.argv[1:])
+    else:
+        main_menu()
\ No newline at end of file
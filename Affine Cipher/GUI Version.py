@@ -3,6 +3,7 @@ from tkinter import ttk, scrolledtext, messagebox
 import string
 import sys
 import math # Needed for GCD check
+from functools import lru_cache
 
 # --- 📚 AFFINE CIPHER LOGIC AND CONSTANTS ---
 
@@ -61,12 +62,67 @@ def affine_transform_char(char, a, b, mode='encrypt'):
 
 # --- Core Cipher Logic ---
 
+# Number of compiled keys kept by compile_affine_key (a session only switches between a few)
+AFFINE_KEY_CACHE_SIZE = 32
+
+class AffineTable(dict):
+    """
+    A str.translate table for one key and direction. ASCII letters are compiled up
+    front; any other code point is resolved through affine_transform_char on first
+    sight and cached, so every character behaves exactly as it does per character.
+    """
+    def __init__(self, a, b, mode):
+        super().__init__()
+        self.a, self.b, self.mode = a, b, mode
+        for char in string.ascii_letters:
+            self[ord(char)] = affine_transform_char(char, a, b, mode)
+
+    def __missing__(self, code_point):
+        result = affine_transform_char(chr(code_point), self.a, self.b, self.mode)
+        self[code_point] = result
+        return result
+
+class AffineKey:
+    """
+    A validated (a, b) key with precomputed encryption and decryption tables,
+    so processing text is a single str.translate call with no per-character dispatch.
+    """
+    def __init__(self, a, b):
+        if a not in MOD_INVERSE:
+            raise ValueError(f"Key 'a' ({a}) is invalid (gcd(a, 26) != 1).")
+        self.a = a
+        self.b = b % ALPHABET_SIZE
+        self.a_inv = MOD_INVERSE[a]
+        self.encrypt_table = AffineTable(self.a, self.b, 'encrypt')
+        self.decrypt_table = AffineTable(self.a, self.b, 'decrypt')
+
+    def encrypt(self, plaintext):
+        """Encrypts text with this key."""
+        return plaintext.translate(self.encrypt_table)
+
+    def decrypt(self, ciphertext):
+        """Decrypts text with this key."""
+        return ciphertext.translate(self.decrypt_table)
+
+    def process(self, text, mode='encrypt'):
+        """Encrypts or decrypts text depending on 'mode'."""
+        if mode == 'encrypt':
+            return self.encrypt(text)
+        if mode == 'decrypt':
+            return self.decrypt(text)
+        raise ValueError("Invalid mode: must be 'encrypt' or 'decrypt'.")
+
+@lru_cache(maxsize=AFFINE_KEY_CACHE_SIZE)
+def compile_affine_key(a, b):
+    """Returns the compiled AffineKey for (a, b), reusing recently compiled keys."""
+    return AffineKey(a, b % ALPHABET_SIZE)
+
 def affine_process_text(text, a, b, mode='encrypt'):
     """
     Encrypts or decrypts text using the Affine Cipher with keys (a, b).
     """
     
-    return ''.join(affine_transform_char(char, a, b, mode) for char in text)
+    return compile_affine_key(a, b).process(text, mode)
 
 # --- 🖥️ TKINTER GUI APPLICATION (DARK MODE) ---
 
@@ -79,6 +135,9 @@ class AffineCipherApp(tk.Tk):
     TEXT_AREA_BG = '#3a3a3a'
     TEXT_AREA_FG = '#e0e0e0'
     BUTTON_BG = '#4f4f4f'
+
+    # Live mode waits this long (ms) after the last edit before patching the output
+    LIVE_DEBOUNCE_MS = 150
     
     def __init__(self):
         super().__init__()
@@ -92,8 +151,13 @@ class AffineCipherApp(tk.Tk):
         self.notebook = ttk.Notebook(self)
         self.notebook.pack(pady=10, padx=10, expand=True, fill="both")
 
+        # Live mode state: edits recorded since the last flush and the pending after() id
+        self.live_pending_edits = []
+        self.live_after_id = None
+
         # Initialize tab (Only one tab for Affine)
         self._create_encrypt_decrypt_tab()
+        self._install_input_proxy()
 
     def _setup_style(self):
         """Configures the global style for Dark Mode."""
@@ -134,6 +198,12 @@ class AffineCipherApp(tk.Tk):
                        background=[('active', self.ACCENT_COLOR), ('pressed', self.ACCENT_COLOR)],
                        foreground=[('active', self.BG_DARK), ('pressed', self.BG_DARK)])
 
+        # Live mode toggle and direction styling
+        for widget_style in ('TCheckbutton', 'TRadiobutton'):
+            self.style.configure(widget_style, background=self.BG_DARK, foreground=self.FG_LIGHT)
+            self.style.map(widget_style, background=[('active', self.BG_DARK)],
+                           indicatorcolor=[('selected', self.ACCENT_COLOR)])
+
     def _create_encrypt_decrypt_tab(self):
         """Creates the Encryption/Decryption tab."""
         tab = ttk.Frame(self.notebook, padding="15")
@@ -179,6 +249,20 @@ class AffineCipherApp(tk.Tk):
         ttk.Button(button_frame, text="ENCRYPT >>", command=lambda: self._handle_process('encrypt')).pack(side=tk.LEFT, padx=20)
         ttk.Button(button_frame, text="<< DECRYPT", command=lambda: self._handle_process('decrypt')).pack(side=tk.LEFT, padx=20)
 
+        # Live mode: re-encrypt as the user types, patching only the edited span
+        self.live_var = tk.BooleanVar(value=False)
+        self.live_mode_var = tk.StringVar(value='encrypt')
+        ttk.Checkbutton(button_frame, text="Live", variable=self.live_var,
+                        command=self._schedule_live_resync).pack(side=tk.LEFT, padx=(20, 5))
+        ttk.Radiobutton(button_frame, text="Encrypt", value='encrypt', variable=self.live_mode_var,
+                        command=self._schedule_live_resync).pack(side=tk.LEFT, padx=5)
+        ttk.Radiobutton(button_frame, text="Decrypt", value='decrypt', variable=self.live_mode_var,
+                        command=self._schedule_live_resync).pack(side=tk.LEFT, padx=5)
+
+        # Changing a key invalidates the whole output in live mode
+        for entry in (self.key_a_entry, self.key_b_entry):
+            entry.bind('<KeyRelease>', lambda event: self._schedule_live_resync())
+
         # 4. Output Text Area
         ttk.Label(tab, text="Output Result:").grid(row=4, column=0, padx=5, pady=5, sticky="nw")
         self.output_text_area = scrolledtext.ScrolledText(tab, wrap=tk.WORD, height=8, font=('Inter', 10), state='disabled',
@@ -192,22 +276,29 @@ class AffineCipherApp(tk.Tk):
 
     # --- 🛠️ HANDLER METHODS ---
 
-    def _get_keys(self):
-        """Retrieves and validates the 'a' and 'b' keys."""
+    def _get_keys(self, quiet=False):
+        """
+        Retrieves and validates the 'a' and 'b' keys. Errors open a message box,
+        or only update the status label when 'quiet' (used while typing in live mode).
+        """
+        def fail(title, message):
+            if quiet:
+                self.status_label.config(text=message, foreground='#ff4444')
+            else:
+                messagebox.showerror(title, message)
+            return None, None
+
         try:
             a = int(self.key_a_entry.get())
             b = int(self.key_b_entry.get())
         except ValueError:
-            messagebox.showerror("Input Error", "Keys 'a' and 'b' must be integers.")
-            return None, None
+            return fail("Input Error", "Keys 'a' and 'b' must be integers.")
             
         if not (1 <= a <= 25 and 0 <= b <= 25):
-            messagebox.showerror("Input Error", "Key 'a' must be 1-25. Key 'b' must be 0-25.")
-            return None, None
+            return fail("Input Error", "Key 'a' must be 1-25. Key 'b' must be 0-25.")
             
         if a not in MOD_INVERSE:
-            messagebox.showerror("Key Error", f"Key 'a' ({a}) is invalid. It must be coprime with 26 (gcd(a, 26)=1).")
-            return None, None
+            return fail("Key Error", f"Key 'a' ({a}) is invalid. It must be coprime with 26 (gcd(a, 26)=1).")
             
         return a, b
 
@@ -225,6 +316,12 @@ class AffineCipherApp(tk.Tk):
 
     def _handle_process(self, mode):
         """Handler for Encrypt/Decrypt buttons."""
+        if self.live_var.get():
+            # In live mode the buttons just pick the direction; the output mirrors the input
+            self.live_mode_var.set(mode)
+            self._schedule_live_resync()
+            return
+
         a, b = self._get_keys()
         if a is None:
             return # Validation failed
@@ -248,6 +345,93 @@ class AffineCipherApp(tk.Tk):
             self._update_output(self.output_text_area, f"An unexpected error occurred: {e}", is_error=True)
 
 
+    # --- ⚡ LIVE MODE (INCREMENTAL RE-ENCRYPTION) ---
+
+    def _install_input_proxy(self):
+        """
+        Routes the input widget's Tcl command through _input_proxy so every insert,
+        delete and replace can be recorded with the exact span it touches.
+        """
+        widget_name = str(self.input_text_area)
+        self.input_widget_command = widget_name + '_orig'
+        self.tk.call('rename', widget_name, self.input_widget_command)
+        self.tk.createcommand(widget_name, self._input_proxy)
+
+    def _input_proxy(self, command, *args):
+        """Records edits (with indices resolved before they run), then performs the command."""
+        if self.live_var.get() and command in ('insert', 'delete', 'replace'):
+            self._record_live_edit(command, args)
+        return self.tk.call((self.input_widget_command, command) + args)
+
+    def _input_index(self, index):
+        """Resolves any Text index (marks, 'end', '+1c', ...) to 'line.char' form."""
+        return self.tk.call(self.input_widget_command, 'index', index)
+
+    def _record_live_edit(self, command, args):
+        """Queues one edit for the next debounced flush."""
+        if command == 'insert':
+            # insert index chars ?tagList chars tagList ...?
+            self.live_pending_edits.append(('insert', self._input_index(args[0]), ''.join(args[1::2])))
+        elif command == 'delete' and len(args) <= 2:
+            start = self._input_index(args[0])
+            end = self._input_index(args[1] if len(args) == 2 else f'{start} + 1 chars')
+            self.live_pending_edits.append(('delete', start, end))
+        elif command == 'replace':
+            # replace index1 index2 chars ?tagList chars tagList ...?
+            start, end = self._input_index(args[0]), self._input_index(args[1])
+            self.live_pending_edits.append(('delete', start, end))
+            self.live_pending_edits.append(('insert', start, ''.join(args[2::2])))
+        else:
+            # Multi-range deletes are rare; fall back to a full re-encryption
+            self.live_pending_edits.append(('resync',))
+        self._schedule_live_flush()
+
+    def _schedule_live_flush(self):
+        """Debounces flushes: each new edit restarts the timer."""
+        if self.live_after_id is not None:
+            self.after_cancel(self.live_after_id)
+        self.live_after_id = self.after(self.LIVE_DEBOUNCE_MS, self._flush_live_edits)
+
+    def _schedule_live_resync(self):
+        """Queues a full re-encryption (live mode toggled, key or direction changed)."""
+        if self.live_var.get():
+            self.live_pending_edits = [('resync',)]
+            self._schedule_live_flush()
+
+    def _flush_live_edits(self):
+        """
+        Replays the queued edits on the output widget. The Affine cipher maps each
+        character independently (and one-to-one), so the output mirrors the input
+        index for index and only the edited spans need to be transformed.
+        """
+        self.live_after_id = None
+        edits, self.live_pending_edits = self.live_pending_edits, []
+        if not self.live_var.get() or not edits:
+            return
+
+        a, b = self._get_keys(quiet=True)
+        if a is None:
+            # Keys are invalid right now; re-encrypt everything once they are fixed
+            self.live_pending_edits = [('resync',)]
+            return
+        key = compile_affine_key(a, b)
+        mode = self.live_mode_var.get()
+
+        output = self.output_text_area
+        output.config(state='normal')
+        if any(edit[0] == 'resync' for edit in edits):
+            output.delete('1.0', tk.END)
+            output.insert('1.0', key.process(self.input_text_area.get('1.0', 'end - 1 chars'), mode))
+        else:
+            for edit in edits:
+                if edit[0] == 'insert':
+                    output.insert(edit[1], key.process(edit[2], mode))
+                else:
+                    output.delete(edit[1], edit[2])
+        output.config(state='disabled')
+        self.status_label.config(text="", foreground=self.BG_DARK)
+
+
 if __name__ == "__main__":
     # Initialize and run the GUI application
     try:
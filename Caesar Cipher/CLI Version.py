@@ -1,5 +1,17 @@
 import sys
-import string # Although string is imported, it's not strictly necessary for the current logic using ord() and chr()
+import time
+import argparse
+import string # Used to build the precompiled shift tables
+from collections import Counter
+
+# Standard English letter frequencies (percent), used to score brute-force candidates
+EN_FREQ = {
+    'a': 8.167, 'b': 1.492, 'c': 2.782, 'd': 4.253, 'e': 12.702,
+    'f': 2.228, 'g': 2.015, 'h': 6.094, 'i': 6.966, 'j': 0.153,
+    'k': 0.772, 'l': 4.025, 'm': 2.406, 'n': 6.749, 'o': 7.507,
+    'p': 1.929, 'q': 0.095, 'r': 5.987, 's': 6.327, 't': 9.056,
+    'u': 2.758, 'v': 0.978, 'w': 2.360, 'x': 0.150, 'y': 1.974, 'z': 0.074
+}
 
 # --- Core Cipher Logic ---
 
@@ -21,10 +33,19 @@ def caesar_shift_char(char, shift):
     # Return non-alphabetic characters unchanged
     return char
 
+def build_shift_table(shift):
+    """Builds a str.translate table that applies caesar_shift_char for one shift."""
+    letters = string.ascii_lowercase + string.ascii_uppercase
+    return str.maketrans(letters, ''.join(caesar_shift_char(char, shift) for char in letters))
+
+# All 26 translation tables are compiled once at import time, so the hot path
+# is a single C-level str.translate call instead of one Python call per character.
+SHIFT_TABLES = [build_shift_table(shift) for shift in range(26)]
+
 def caesar_encrypt(text, shift):
     """Encrypts text by applying the character shift to every character."""
-    # Use a generator expression for better performance and readability
-    return ''.join(caesar_shift_char(char, shift) for char in text)
+    # Any integer shift (including negative ones) maps onto one of the 26 tables
+    return text.translate(SHIFT_TABLES[shift % 26])
 
 def caesar_decrypt(ciphertext, shift):
     """Decrypts ciphertext by applying the character shift in reverse."""
@@ -32,6 +53,107 @@ def caesar_decrypt(ciphertext, shift):
     # Python's % operator handles negative numbers correctly for this purpose.
     return caesar_encrypt(ciphertext, -shift)
 
+# --- Binary-Safe Cipher Logic ---
+
+# Byte-level counterparts of SHIFT_TABLES: only ASCII letters are remapped
+ASCII_LETTERS = string.ascii_lowercase + string.ascii_uppercase
+BYTE_SHIFT_TABLES = [
+    bytes.maketrans(ASCII_LETTERS.encode('ascii'), ASCII_LETTERS.translate(table).encode('ascii'))
+    for table in SHIFT_TABLES
+]
+
+# In-place mode translates in blocks of this size, so temporaries stay small
+IN_PLACE_BLOCK_SIZE = 1 << 16
+
+def caesar_encrypt_bytes(data, shift, in_place=False):
+    """
+    Encrypts bytes-like data (bytes, bytearray or memoryview), shifting ASCII letters only.
+    bytes and bytearray inputs return the same type; a memoryview returns bytes.
+    With in_place=True a writable buffer (e.g. a bytearray) is modified and returned.
+    """
+    table = BYTE_SHIFT_TABLES[shift % 26]
+
+    if in_place:
+        view = memoryview(data).cast('B')
+        if view.readonly:
+            raise TypeError("In-place mode requires a writable buffer such as a bytearray.")
+        for start in range(0, len(view), IN_PLACE_BLOCK_SIZE):
+            block = view[start:start + IN_PLACE_BLOCK_SIZE]
+            block[:] = block.tobytes().translate(table)
+        return data
+
+    if isinstance(data, (bytes, bytearray)):
+        return data.translate(table)
+    return memoryview(data).tobytes().translate(table)
+
+def caesar_decrypt_bytes(data, shift, in_place=False):
+    """Decrypts bytes-like data by applying the byte shift in reverse."""
+    return caesar_encrypt_bytes(data, -shift, in_place)
+
+# --- Cryptanalysis Logic ---
+
+PREVIEW_LENGTH = 60 # Characters decrypted for each non-winning candidate
+CONFIDENCE_MARGIN = 3.0 # The winner's Chi-squared score must be this many times lower than the runner-up's
+
+def count_letters(text):
+    """Counts 'a'-'z' case-insensitively in one pass; returns the 26 counts and their total."""
+    counts = Counter(text)
+    letter_counts = [counts.get(lo, 0) + counts.get(up, 0)
+                     for lo, up in zip(string.ascii_lowercase, string.ascii_uppercase)]
+    return letter_counts, sum(letter_counts)
+
+def score_keys_by_rotation(letter_counts, total_letters, freq_table=EN_FREQ):
+    """
+    Normalized Chi-squared score of every key (shift 1-25) against English, computed
+    from the ciphertext counts alone: decrypting with key k turns ciphertext letter
+    (i + k) into plaintext letter i, so no candidate text has to be built.
+    Returns (key, score) pairs sorted by score (best first).
+    """
+    if not total_letters:
+        return [(key, float('inf')) for key in range(1, 26)]
+
+    expected = [freq_table[ch] * total_letters / 100.0 for ch in string.ascii_lowercase]
+    scores = []
+    for key in range(1, 26):
+        score = sum((letter_counts[(i + key) % 26] - expected_count) ** 2 / expected_count
+                    for i, expected_count in enumerate(expected))
+        scores.append((key, score / total_letters))
+
+    scores.sort(key=lambda x: x[1])
+    return scores
+
+def brute_force_candidates(ciphertext, preview_length=PREVIEW_LENGTH):
+    """
+    Lazily yields (key, preview, score) for every key, most English-like first.
+    Letters are counted once; each candidate only decrypts its preview when requested.
+    """
+    letter_counts, total_letters = count_letters(ciphertext)
+    preview_source = ciphertext[:preview_length]
+    for key, score in score_keys_by_rotation(letter_counts, total_letters):
+        yield key, caesar_decrypt(preview_source, key), score
+
+def confident_brute_force(ciphertext, margin=CONFIDENCE_MARGIN, preview_length=PREVIEW_LENGTH):
+    """
+    Pulls candidates from brute_force_candidates and stops as soon as the best one
+    beats the rest by 'margin'. Only the winner is decrypted in full.
+    Returns (best_key, plaintext, previews, confident), where previews holds the
+    (key, preview, score) candidates that were examined. Without any letters every
+    key scores inf, so the result is never confident.
+    """
+    candidates = brute_force_candidates(ciphertext, preview_length)
+    best = next(candidates)
+    runner_up = next(candidates)
+
+    confident = best[2] != float('inf') and runner_up[2] >= margin * best[2]
+    if confident:
+        previews = [best]
+    else:
+        # No clear winner: fall back to previews of every key
+        previews = [best, runner_up, *candidates]
+
+    best_key = best[0]
+    return best_key, caesar_decrypt(ciphertext, best_key), previews, confident
+
 # --- Helper Functions ---
 
 def get_valid_key():
@@ -77,25 +199,109 @@ def run_decryption_mode():
 
 def run_brute_force_mode():
     """
-    Attempts decryption using every possible key (shift 1-25).
+    Attempts decryption using every possible key (shift 1-25), ranked by English letter
+    frequency. Stops early once one key is clearly the best.
     Demonstrates the fundamental weakness of the Caesar Cipher.
     """
     print("\n--- BRUTE FORCE ATTACK MODE ---")
     print("This mode demonstrates the weakness of the Caesar Cipher by trying all 25 possible keys.")
     ciphertext = input("  Enter Ciphertext to Crack: ")
     
-    print("\n--- POSSIBLE DECRYPTIONS (Keys 1-25) ---")
-    
-    # Iterate through all 25 possible keys (shifts)
-    for key in range(1, 26):
-        # Decrypt using the current key
-        decrypted_text = caesar_decrypt(ciphertext, key)
-        
-        # Display the result for each key, formatted neatly
-        print(f"  Key {key:2}: {decrypted_text}") 
+    best_key, plaintext, previews, confident = confident_brute_force(ciphertext)
+    if previews[0][2] == float('inf'):
+        print("\n  The ciphertext contains no letters, so there is nothing to analyze.\n")
+        return
+
+    if confident:
+        print(f"\n--- CLEAR WINNER (Key {best_key} beats every other key by at least {CONFIDENCE_MARGIN:g}x) ---")
+    else:
+        print(f"\n--- POSSIBLE DECRYPTIONS (Keys 1-25, most likely first, first {PREVIEW_LENGTH} characters) ---")
+        for key, preview, score in previews:
+            # Display the preview for each key, formatted neatly
+            print(f"  Key {key:2}: {preview}")
+
+    print(f"\n  Most likely key: {best_key}")
+    print(f"  Decrypted:  {plaintext}")
+
+    print("\n  With only 25 keys, a computer can try every option instantly, rendering the cipher useless for security.\n")
+
+# --- Streaming File Mode ---
+
+STREAM_CHUNK_SIZE = 1 << 20 # 1 MiB per read keeps memory bounded regardless of file size
+
+def caesar_stream(source, sink, shift, chunk_size=STREAM_CHUNK_SIZE):
+    """
+    Encrypts a binary stream chunk by chunk, writing each result as soon as it is ready.
+    A single buffer is reused for every chunk and shifted in place.
+    Returns the number of bytes processed.
+    """
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+    processed = 0
+    while True:
+        size = source.readinto(buffer)
+        if not size:
+            break
+        chunk = view[:size]
+        caesar_encrypt_bytes(chunk, shift, in_place=True)
+        sink.write(chunk)
+        processed += size
+    return processed
+
+def open_stream(path, mode):
+    """Opens a file in binary mode, or stdin/stdout for '-'."""
+    if path == '-':
+        return open((sys.stdin if mode == 'r' else sys.stdout).fileno(), mode + 'b', closefd=False)
+    return open(path, mode + 'b')
+
+def run_crack_mode(args):
+    """Non-interactive brute force: prints the winning plaintext, with the ranking on stderr."""
+    with open_stream(args.input, 'r') as source:
+        ciphertext = source.read().decode('latin-1')
+
+    best_key, plaintext, previews, confident = confident_brute_force(ciphertext, args.margin)
+    if previews[0][2] == float('inf'):
+        sys.exit("  Error: the input contains no letters, so there is nothing to analyze.")
+
+    for key, preview, score in previews:
+        print(f"  Key {key:2} (score {score:.4f}): {preview}", file=sys.stderr)
+    verdict = "confident" if confident else "not confident"
+    print(f"  Most likely key: {best_key} ({verdict})", file=sys.stderr)
+
+    with open_stream(args.output, 'w') as sink:
+        sink.write(plaintext.encode('latin-1'))
+
+def run_stream_mode(argv):
+    """Non-interactive entry point: streams a file or stdin through the cipher, or cracks it."""
+    parser = argparse.ArgumentParser(description="Caesar Cipher streaming mode (files or stdin/stdout).")
+    parser.add_argument('mode', choices=['encrypt', 'decrypt', 'crack'])
+    parser.add_argument('key', type=int, nargs='?', help="Shift key (any integer, applied modulo 26); not used by crack")
+    parser.add_argument('-i', '--input', default='-', help="Input file (default: stdin)")
+    parser.add_argument('-o', '--output', default='-', help="Output file (default: stdout)")
+    parser.add_argument('--chunk-size', type=int, default=STREAM_CHUNK_SIZE, help="Bytes read per chunk")
+    parser.add_argument('--margin', type=float, default=CONFIDENCE_MARGIN,
+                        help="crack: how many times better the winning score must be than the runner-up")
+    args = parser.parse_args(argv)
+
+    if args.mode == 'crack':
+        run_crack_mode(args)
+        return
+
+    if args.key is None:
+        parser.error(f"{args.mode} requires a key")
+    if args.chunk_size < 1:
+        parser.error("--chunk-size must be a positive integer")
+    # Decryption is encryption with a negative shift, exactly as in caesar_decrypt
+    shift = args.key if args.mode == 'encrypt' else -args.key
+
+    start = time.perf_counter()
+    with open_stream(args.input, 'r') as source, open_stream(args.output, 'w') as sink:
+        processed = caesar_stream(source, sink, shift, args.chunk_size)
+    elapsed = time.perf_counter() - start
 
-    print("\n  **The correct decryption is one of the messages above.**")
-    print("  With only 25 keys, a computer can try every option instantly, rendering the cipher useless for security.\n")
+    # Report on stderr so that stdout stays clean for piping
+    throughput = processed / elapsed / 1e6 if elapsed > 0 else float('inf')
+    print(f"  Processed {processed / 1e6:.2f} MB in {elapsed:.3f}s ({throughput:.2f} MB/s)", file=sys.stderr)
 
 # --- Main Program Loop ---
 
@@ -129,4 +335,8 @@ def main_menu():
 
 # Standard Python idiom to run the main function
 if __name__ == '__main__':
-    main_menu()
\ No newline at end of file
+    # Any command-line arguments select the non-interactive streaming mode
+    if len(sys.argv) > 1:
+        run_stream_mode(sys.argv[1:])
+    else:
+        main_menu()
\ No newline at end of file
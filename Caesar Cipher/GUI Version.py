@@ -3,6 +3,15 @@ from tkinter import ttk, scrolledtext, messagebox
 import string
 from collections import Counter
 import sys
+import threading
+import queue
+import json
+import math
+import os
+try:
+    import numpy as np
+except ImportError:
+    np = None # NumPy is optional; only the batch cracker needs it
 
 # --- 📚 CAESAR CIPHER LOGIC AND CONSTANTS ---
 
@@ -20,6 +29,124 @@ EN_FREQ = {
     'u': 2.758, 'v': 0.978, 'w': 2.360, 'x': 0.150, 'y': 1.974, 'z': 0.074
 }
 
+# Base-letter frequencies (accents folded away) for other supported languages
+FR_FREQ = {
+    'a': 7.636, 'b': 0.901, 'c': 3.260, 'd': 3.669, 'e': 14.715,
+    'f': 1.066, 'g': 0.866, 'h': 0.737, 'i': 7.529, 'j': 0.613,
+    'k': 0.074, 'l': 5.456, 'm': 2.968, 'n': 7.095, 'o': 5.796,
+    'p': 2.521, 'q': 1.362, 'r': 6.693, 's': 7.948, 't': 7.244,
+    'u': 6.311, 'v': 1.838, 'w': 0.049, 'x': 0.427, 'y': 0.128, 'z': 0.326
+}
+
+DE_FREQ = {
+    'a': 6.516, 'b': 1.886, 'c': 2.732, 'd': 5.076, 'e': 16.396,
+    'f': 1.656, 'g': 3.009, 'h': 4.577, 'i': 6.550, 'j': 0.268,
+    'k': 1.417, 'l': 3.437, 'm': 2.534, 'n': 9.776, 'o': 2.594,
+    'p': 0.670, 'q': 0.018, 'r': 7.003, 's': 7.270, 't': 6.154,
+    'u': 4.166, 'v': 0.846, 'w': 1.921, 'x': 0.034, 'y': 0.039, 'z': 1.134
+}
+
+ES_FREQ = {
+    'a': 11.525, 'b': 2.215, 'c': 4.019, 'd': 5.010, 'e': 12.181,
+    'f': 0.692, 'g': 1.768, 'h': 0.703, 'i': 6.247, 'j': 0.493,
+    'k': 0.011, 'l': 4.967, 'm': 3.157, 'n': 6.712, 'o': 8.683,
+    'p': 2.510, 'q': 0.877, 'r': 6.871, 's': 7.977, 't': 4.632,
+    'u': 2.927, 'v': 1.138, 'w': 0.017, 'x': 0.215, 'y': 1.008, 'z': 0.467
+}
+
+# --- 🌍 LANGUAGE FREQUENCY MODELS ---
+
+class FrequencyModel:
+    """
+    A letter-frequency table compiled once into dense 26-element vectors:
+    the percentages (Chi-squared expectations per 100 letters) and the
+    log-probabilities (for log-likelihood scoring). Both scorers work directly
+    on a letter count vector, optionally rotated by a Caesar shift.
+    """
+    # Probability given to letters a table leaves out, so log-likelihoods stay finite
+    MISSING_LETTER_PROBABILITY = 1e-5
+
+    def __init__(self, name, freq_table):
+        self.name = name
+        self.freq_table = freq_table
+        self.percentages = [float(freq_table.get(ch, 0)) for ch in ALPH_LO]
+
+        # Chi-squared only sums over letters with a non-zero expectation
+        self.expected_terms = [(i, pct) for i, pct in enumerate(self.percentages) if pct > 0]
+
+        total = sum(self.percentages)
+        if total <= 0:
+            raise ValueError(f"Frequency model '{name}' has no positive letter frequencies.")
+        self.log_probabilities = [math.log(max(pct / total, self.MISSING_LETTER_PROBABILITY))
+                                  for pct in self.percentages]
+
+    def chi_squared(self, letter_counts, total_letters, shift=0):
+        """
+        Normalized Chi-squared score of the counts (rotated by 'shift') against this
+        language. Lower is a better fit; inf for texts without letters.
+        """
+        if not total_letters:
+            return float('inf')
+        score = 0.0
+        for i, pct in self.expected_terms:
+            expected_count = pct * total_letters / 100.0
+            observed_count = letter_counts[(i + shift) % ALPH_LEN]
+            score += (observed_count - expected_count) ** 2 / expected_count
+        return score / total_letters
+
+    def log_likelihood(self, letter_counts, total_letters, shift=0):
+        """
+        Average log-probability per letter of the counts (rotated by 'shift') under
+        this language. Higher is a better fit; -inf for texts without letters.
+        """
+        if not total_letters:
+            return float('-inf')
+        return sum(letter_counts[(i + shift) % ALPH_LEN] * log_p
+                   for i, log_p in enumerate(self.log_probabilities)) / total_letters
+
+# Registry of compiled models, keyed by lower-case language name
+LANGUAGE_MODELS = {}
+
+def register_language_model(name, freq_table):
+    """Compiles a frequency table and registers it under 'name'. Returns the model."""
+    model = FrequencyModel(name.lower(), freq_table)
+    LANGUAGE_MODELS[model.name] = model
+    return model
+
+def load_language_model(path, name=None):
+    """
+    Loads a frequency table from a JSON file ({"a": 8.167, "b": 1.492, ...}, in percent)
+    and registers it. The language name defaults to the file name without extension.
+    """
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    freq_table = {ch.lower(): float(value) for ch, value in data.items() if ch.lower() in ALPH_LO}
+    if name is None:
+        name = os.path.splitext(os.path.basename(path))[0]
+    return register_language_model(name, freq_table)
+
+def get_language_model(model):
+    """
+    Resolves a language name, a FrequencyModel or a plain frequency dict to a compiled
+    model. Registered tables (such as EN_FREQ) are never compiled again.
+    """
+    if isinstance(model, FrequencyModel):
+        return model
+    if isinstance(model, str):
+        try:
+            return LANGUAGE_MODELS[model.lower()]
+        except KeyError:
+            raise ValueError(f"Unknown language model '{model}'. Registered: {', '.join(LANGUAGE_MODELS)}") from None
+    for registered in LANGUAGE_MODELS.values():
+        if registered.freq_table is model:
+            return registered
+    return FrequencyModel('custom', model)
+
+register_language_model('english', EN_FREQ)
+register_language_model('french', FR_FREQ)
+register_language_model('german', DE_FREQ)
+register_language_model('spanish', ES_FREQ)
+
 def caesar_shift_char(char, shift):
     """Shifts a single alphabetic character according to the Caesar Cipher rules."""
     if char.islower():
@@ -30,11 +157,31 @@ def caesar_shift_char(char, shift):
     # Return non-alphabetic characters unchanged
     return char
 
+class ShiftTable(dict):
+    """
+    A str.translate table for one shift. ASCII letters are compiled up front;
+    any other code point is resolved through caesar_shift_char on first sight
+    and cached, so non-ASCII cased characters behave exactly as before.
+    """
+    def __init__(self, shift):
+        super().__init__()
+        self.shift = shift
+        for c in ALPH_LO + ALPH_UP:
+            self[ord(c)] = caesar_shift_char(c, shift)
+
+    def __missing__(self, code_point):
+        result = caesar_shift_char(chr(code_point), self.shift)
+        self[code_point] = result
+        return result
+
+# One table per shift, built once; the hot path is a single str.translate call
+SHIFT_TABLES = [ShiftTable(s) for s in range(ALPH_LEN)]
+
 def caesar_process_text(text, shift):
     """
     General function for encryption (positive shift) or decryption (negative shift).
     """
-    return ''.join(caesar_shift_char(c, shift) for c in text)
+    return text.translate(SHIFT_TABLES[shift % ALPH_LEN])
 
 def brute_force_crack(ciphertext):
     """Attempts all 26 possible decryption shifts (0 through 25)."""
@@ -46,27 +193,23 @@ def score_text_by_frequency(text, freq_table=EN_FREQ):
     Scores a text based on how closely its letter frequency matches the target
     frequency table (e.g., English). It uses a normalized Chi-squared test.
     Lower score indicates a higher probability of being standard English text.
+    'freq_table' may also be a registered language name or a FrequencyModel.
     """
-    text_lower = [c for c in text.lower() if c.isalpha()]
-    if not text_lower:
-        return float('inf') # Worst score for empty or non-alphabetic text
-    
-    counts = Counter(text_lower)
-    total_letters = len(text_lower)
-    score = 0.0
-    
-    # Calculate Chi-squared score
-    for ch in string.ascii_lowercase:
-        observed_count = counts.get(ch, 0)
-        expected_percentage = freq_table.get(ch, 0)
-        expected_count = expected_percentage * total_letters / 100.0
-        
-        # Chi-squared: (Observed - Expected)^2 / Expected
-        if expected_count > 0:
-            score += (observed_count - expected_count) ** 2 / expected_count
-            
-    # Normalize score by text length
-    return score / total_letters
+    letter_counts, total_letters = count_letters(text)
+    return get_language_model(freq_table).chi_squared(letter_counts, total_letters)
+
+def score_text_by_languages(text, languages=None):
+    """
+    Scores a text against several language models after a single counting pass.
+    'languages' is a list of names/models (default: every registered model).
+    Returns (language, chi_squared, log_likelihood) tuples, best Chi-squared fit first.
+    """
+    models = [get_language_model(m) for m in (languages or list(LANGUAGE_MODELS.values()))]
+    letter_counts, total_letters = count_letters(text)
+    results = [(m.name, m.chi_squared(letter_counts, total_letters), m.log_likelihood(letter_counts, total_letters))
+               for m in models]
+    results.sort(key=lambda x: x[1])
+    return results
 
 
 def frequency_analysis_crack(ciphertext):
@@ -85,8 +228,155 @@ def frequency_analysis_crack(ciphertext):
     candidates.sort(key=lambda x: x[2])
     return candidates
 
+def count_letters(text):
+    """
+    Counts the letters of a text in a single pass. Returns a 26-element list of
+    case-folded counts for 'a'-'z' and the total number of alphabetic characters.
+    """
+    counts = Counter(text)
+    letter_counts = [counts.get(lo, 0) + counts.get(up, 0) for lo, up in zip(ALPH_LO, ALPH_UP)]
+    total_letters = sum(n for ch, n in counts.items() if ch.isalpha())
+    return letter_counts, total_letters
+
+def score_shifts_by_rotation(letter_counts, total_letters, freq_table=EN_FREQ):
+    """
+    Scores all 26 decryption shifts from one count vector. Decrypting with shift 's'
+    turns every ciphertext letter (i + s) into plaintext letter i, so the observed
+    counts of a candidate are just the ciphertext counts rotated by 's'.
+    'freq_table' may also be a registered language name or a FrequencyModel.
+    Returns (shift, score) pairs sorted by score (best first).
+    """
+    model = get_language_model(freq_table)
+    scores = [(s, model.chi_squared(letter_counts, total_letters, s)) for s in range(ALPH_LEN)]
+    scores.sort(key=lambda x: x[1])
+    return scores
+
+def rotation_frequency_crack(ciphertext, top_k=5, freq_table=EN_FREQ):
+    """
+    Single-pass variant of frequency_analysis_crack. Letters are counted once,
+    every shift is scored by rotating the count vector, and only the best
+    'top_k' plaintexts are decrypted. Scores match frequency_analysis_crack
+    for ASCII text.
+    """
+    letter_counts, total_letters = count_letters(ciphertext)
+    ranked = score_shifts_by_rotation(letter_counts, total_letters, freq_table)
+    return [(s, caesar_process_text(ciphertext, -s), score) for s, score in ranked[:top_k]]
+
+def brute_force_steps(ciphertext, preview_length=None):
+    """
+    Generator form of brute_force_crack for background workers. Yields (done, total)
+    progress after each shift and returns the candidate list. With 'preview_length'
+    only that many leading characters are decrypted per shift.
+    """
+    source = ciphertext if preview_length is None else ciphertext[:preview_length]
+    candidates = []
+    for s in range(ALPH_LEN):
+        candidates.append((s, caesar_process_text(source, -s)))
+        yield s + 1, ALPH_LEN
+    return candidates
+
+def rotation_frequency_steps(ciphertext, top_k=5, chunk_size=1 << 20, preview_length=None):
+    """
+    Generator form of rotation_frequency_crack for background workers. Letters are
+    counted one chunk at a time so progress can be reported (and the work cancelled)
+    between chunks. Yields (done, total) progress and returns the top candidates.
+    With 'preview_length' only the best candidate is decrypted in full; the others
+    decrypt just that many leading characters.
+    """
+    chunk_starts = range(0, len(ciphertext), chunk_size)
+    total_steps = len(chunk_starts) + top_k
+    done = 0
+
+    letter_counts, total_letters = [0] * ALPH_LEN, 0
+    for start in chunk_starts:
+        chunk_counts, chunk_total = count_letters(ciphertext[start:start + chunk_size])
+        letter_counts = [a + b for a, b in zip(letter_counts, chunk_counts)]
+        total_letters += chunk_total
+        done += 1
+        yield done, total_steps
+
+    preview_source = ciphertext if preview_length is None else ciphertext[:preview_length]
+    candidates = []
+    for rank, (s, score) in enumerate(score_shifts_by_rotation(letter_counts, total_letters)[:top_k]):
+        candidates.append((s, caesar_process_text(ciphertext if rank == 0 else preview_source, -s), score))
+        done += 1
+        yield done, total_steps
+    return candidates
+
+def batch_brute_force_crack(ciphertexts, freq_table=EN_FREQ, batch_size=4096):
+    """
+    Cracks many ciphertexts at once with NumPy. Each batch of messages is packed
+    into one flat uint8 array, letters are counted with a single bincount, and all
+    26 shifts of every message are scored together by broadcasting the rotated
+    count vectors against the expected frequencies (same Chi-squared as
+    score_text_by_frequency, for ASCII letters).
+    Returns two arrays: the best decryption shift and its score for each message.
+    """
+    if np is None:
+        raise ImportError("batch_brute_force_crack requires the NumPy library (pip install numpy).")
+
+    freq = np.array(get_language_model(freq_table).percentages, dtype=np.float64)
+    # rotation[s, i] is the ciphertext letter that decrypts to letter i under shift s
+    rotation = (np.arange(ALPH_LEN)[None, :] + np.arange(ALPH_LEN)[:, None]) % ALPH_LEN
+
+    best_shifts = np.zeros(len(ciphertexts), dtype=np.int64)
+    best_scores = np.full(len(ciphertexts), np.inf)
+
+    for start in range(0, len(ciphertexts), batch_size):
+        batch = [c.encode('utf-8') for c in ciphertexts[start:start + batch_size]]
+        lengths = np.fromiter((len(b) for b in batch), dtype=np.int64, count=len(batch))
+        packed = np.frombuffer(b''.join(batch), dtype=np.uint8)
+
+        # Fold case and map 'a'-'z' to 0-25; everything else goes to bucket 26
+        index = (packed | 0x20) - ord('a')
+        index = np.where(index < ALPH_LEN, index, ALPH_LEN).astype(np.int64)
+        message_ids = np.repeat(np.arange(len(batch)), lengths)
+        counts = np.bincount(message_ids * (ALPH_LEN + 1) + index, minlength=len(batch) * (ALPH_LEN + 1))
+        counts = counts.reshape(len(batch), ALPH_LEN + 1)[:, :ALPH_LEN].astype(np.float64)
+        totals = counts.sum(axis=1)
+
+        observed = counts[:, rotation] # (messages, shifts, letters)
+        expected = freq[None, None, :] * totals[:, None, None] / 100.0
+        terms = np.divide((observed - expected) ** 2, expected,
+                          out=np.zeros_like(observed), where=expected > 0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            scores = np.where(totals[:, None] > 0, terms.sum(axis=2) / totals[:, None], np.inf)
+
+        best_shifts[start:start + len(batch)] = scores.argmin(axis=1)
+        best_scores[start:start + len(batch)] = scores.min(axis=1)
+
+    return best_shifts, best_scores
+
 # --- 🖥️ TKINTER GUI APPLICATION (DARK MODE) ---
 
+class BackgroundJob:
+    """
+    Runs a step generator on a worker thread. Progress, the final result or an error
+    are posted to a queue that the Tk thread drains with after() polling; setting
+    the cancel event stops the worker at the next step.
+    """
+    def __init__(self, steps):
+        self.steps = steps
+        self.messages = queue.Queue()
+        self.cancel_event = threading.Event()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        self.thread.start()
+
+    def cancel(self):
+        self.cancel_event.set()
+
+    def _run(self):
+        try:
+            while not self.cancel_event.is_set():
+                self.messages.put(('progress', next(self.steps)))
+            self.messages.put(('cancelled', None))
+        except StopIteration as stop:
+            self.messages.put(('done', stop.value))
+        except Exception as e:
+            self.messages.put(('error', e))
+
 class CaesarCipherApp(tk.Tk):
     
     # Dark Mode Color Constants
@@ -96,6 +386,15 @@ class CaesarCipherApp(tk.Tk):
     TEXT_AREA_BG = '#3a3a3a'
     TEXT_AREA_FG = '#e0e0e0'
     BUTTON_BG = '#4f4f4f'
+
+    # How often (ms) the Tk thread polls background attack jobs
+    POLL_INTERVAL_MS = 50
+
+    # Characters decrypted per shift for the brute force table
+    BRUTE_FORCE_PREVIEW_LENGTH = 70
+
+    # Characters shown per runner-up in the frequency analysis ranking
+    FREQUENCY_PREVIEW_LENGTH = 55
     
     def __init__(self):
         super().__init__()
@@ -105,6 +404,12 @@ class CaesarCipherApp(tk.Tk):
         # Setup visual styling
         self._setup_style()
         
+        # Running background attack job per output widget
+        self.jobs = {}
+
+        # Ciphertext of the last brute force run, decrypted in full on row selection
+        self.brute_force_ciphertext = ''
+        
         # Main container for tabs
         self.notebook = ttk.Notebook(self)
         self.notebook.pack(pady=10, padx=10, expand=True, fill="both")
@@ -149,6 +454,16 @@ class CaesarCipherApp(tk.Tk):
                              font=('Inter', 10, 'bold'),
                              borderwidth=0,
                              padding=[10, 6])
+        self.style.configure('Horizontal.TProgressbar', background=self.ACCENT_COLOR,
+                             troughcolor=self.TEXT_AREA_BG, borderwidth=0)
+        # Treeview (brute force candidate table) styling
+        self.style.configure('Treeview', background=self.TEXT_AREA_BG, fieldbackground=self.TEXT_AREA_BG,
+                             foreground=self.TEXT_AREA_FG, font=('monospace', 9), borderwidth=0)
+        self.style.configure('Treeview.Heading', background=self.BUTTON_BG, foreground=self.FG_LIGHT,
+                             font=('Inter', 10, 'bold'))
+        self.style.map('Treeview', background=[('selected', self.ACCENT_COLOR)],
+                       foreground=[('selected', self.BG_DARK)])
+
         self.style.map('TButton', 
                        background=[('active', self.ACCENT_COLOR), ('pressed', self.ACCENT_COLOR)],
                        foreground=[('active', self.BG_DARK), ('pressed', self.BG_DARK)])
@@ -201,6 +516,7 @@ class CaesarCipherApp(tk.Tk):
         
         tab.grid_columnconfigure(0, weight=1)
         tab.grid_rowconfigure(4, weight=1) 
+        tab.grid_rowconfigure(6, weight=1) 
 
         # 1. Input Ciphertext
         ttk.Label(tab, text="Enter Ciphertext for Brute Force:").grid(row=0, column=0, padx=5, pady=5, sticky="w")
@@ -210,14 +526,38 @@ class CaesarCipherApp(tk.Tk):
         self.brute_force_input.grid(row=1, column=0, padx=5, pady=5, sticky="ew")
 
         # 2. Action Button
-        ttk.Button(tab, text="RUN BRUTE FORCE (26 Possibilities)", command=self._handle_brute_force).grid(row=2, column=0, pady=10)
-
-        # 3. Output Area
-        ttk.Label(tab, text="All 26 Plaintext Candidates (Shift 0-25):").grid(row=3, column=0, padx=5, pady=5, sticky="w")
+        (self.brute_force_run_button, self.brute_force_cancel_button,
+         self.brute_force_progress) = self._create_attack_controls(
+            tab, "RUN BRUTE FORCE (26 Possibilities)", self._handle_brute_force,
+            lambda: self._cancel_attack(self.brute_force_output))
+
+        # 3. Candidate Table (previews only; selecting a row decrypts that shift in full)
+        ttk.Label(tab, text="All 26 Plaintext Candidates (Shift 0-25) - select a row for the full text:").grid(row=3, column=0, padx=5, pady=5, sticky="w")
+
+        table_frame = ttk.Frame(tab)
+        table_frame.grid(row=4, column=0, padx=5, pady=5, sticky="nsew")
+        table_frame.grid_columnconfigure(0, weight=1)
+        table_frame.grid_rowconfigure(0, weight=1)
+
+        self.brute_force_table = ttk.Treeview(table_frame, columns=('shift', 'plaintext'), show='headings',
+                                              height=8, selectmode='browse')
+        self.brute_force_table.heading('shift', text="Shift")
+        self.brute_force_table.heading('plaintext', text=f"Plaintext (First {self.BRUTE_FORCE_PREVIEW_LENGTH} Characters)", anchor='w')
+        self.brute_force_table.column('shift', width=60, stretch=False, anchor='center')
+        self.brute_force_table.column('plaintext', anchor='w')
+        self.brute_force_table.grid(row=0, column=0, sticky="nsew")
+        self.brute_force_table.bind('<<TreeviewSelect>>', self._handle_brute_force_select)
+
+        table_scrollbar = ttk.Scrollbar(table_frame, orient=tk.VERTICAL, command=self.brute_force_table.yview)
+        table_scrollbar.grid(row=0, column=1, sticky="ns")
+        self.brute_force_table.config(yscrollcommand=table_scrollbar.set)
+
+        # 4. Output Area (status messages and the selected full plaintext)
+        ttk.Label(tab, text="Full Plaintext for Selected Shift:").grid(row=5, column=0, padx=5, pady=5, sticky="w")
         
-        self.brute_force_output = scrolledtext.ScrolledText(tab, wrap=tk.WORD, height=15, font=('monospace', 9), state='disabled',
+        self.brute_force_output = scrolledtext.ScrolledText(tab, wrap=tk.WORD, height=8, font=('Inter', 10), state='disabled',
                                                             bg=self.TEXT_AREA_BG, fg=self.TEXT_AREA_FG, insertbackground=self.FG_LIGHT)
-        self.brute_force_output.grid(row=4, column=0, padx=5, pady=5, sticky="nsew")
+        self.brute_force_output.grid(row=6, column=0, padx=5, pady=5, sticky="nsew")
 
     def _create_frequency_analysis_tab(self):
         """Creates the Frequency Analysis Cracking tab."""
@@ -235,7 +575,10 @@ class CaesarCipherApp(tk.Tk):
         self.freq_analysis_input.grid(row=1, column=0, padx=5, pady=5, sticky="ew")
 
         # 2. Action Button
-        ttk.Button(tab, text="RUN FREQUENCY ANALYSIS (Predict Key)", command=self._handle_frequency_analysis).grid(row=2, column=0, pady=10)
+        (self.freq_analysis_run_button, self.freq_analysis_cancel_button,
+         self.freq_analysis_progress) = self._create_attack_controls(
+            tab, "RUN FREQUENCY ANALYSIS (Predict Key)", self._handle_frequency_analysis,
+            lambda: self._cancel_attack(self.freq_analysis_output))
 
         # 3. Output Area
         ttk.Label(tab, text="5 Most Likely Plaintext Candidates:").grid(row=3, column=0, padx=5, pady=5, sticky="w")
@@ -249,6 +592,20 @@ class CaesarCipherApp(tk.Tk):
                   font=('Inter', 9, 'italic')).grid(row=5, column=0, sticky="w", pady=(5, 0))
 
 
+    def _create_attack_controls(self, tab, run_text, run_command, cancel_command):
+        """Creates the Run/Cancel buttons and progress bar shared by the attack tabs."""
+        control_frame = ttk.Frame(tab)
+        control_frame.grid(row=2, column=0, pady=10)
+
+        run_button = ttk.Button(control_frame, text=run_text, command=run_command)
+        run_button.pack(side=tk.LEFT, padx=10)
+        cancel_button = ttk.Button(control_frame, text="CANCEL", command=cancel_command, state='disabled')
+        cancel_button.pack(side=tk.LEFT, padx=10)
+        progress = ttk.Progressbar(control_frame, orient=tk.HORIZONTAL, length=200, mode='determinate')
+        progress.pack(side=tk.LEFT, padx=10)
+
+        return run_button, cancel_button, progress
+
     # --- 🛠️ HANDLER METHODS ---
 
     def _get_shift(self):
@@ -288,26 +645,95 @@ class CaesarCipherApp(tk.Tk):
             decrypted_text = caesar_process_text(text, -shift)
             self._update_output(self.output_text_area, decrypted_text)
             
+    def _start_attack(self, steps, format_result, widget, run_button, cancel_button, progress, on_done=None):
+        """
+        Runs an attack on a worker thread and polls it from the Tk event loop.
+        The result is formatted on the worker as well, so the Tk thread only displays it:
+        by default the formatted text goes into 'widget', otherwise it is passed to 'on_done'.
+        """
+        def formatted_steps():
+            result = yield from steps
+            return format_result(result)
+
+        job = BackgroundJob(formatted_steps())
+        self.jobs[widget] = job
+        run_button.config(state='disabled')
+        cancel_button.config(state='normal')
+        progress.config(value=0, maximum=1)
+        self._update_output(widget, "Working...", font=('Inter', 10))
+        job.start()
+        self.after(self.POLL_INTERVAL_MS, self._poll_attack, job, widget,
+                   run_button, cancel_button, progress, on_done)
+
+    def _poll_attack(self, job, widget, run_button, cancel_button, progress, on_done):
+        """Drains a job's message queue, updating the progress bar or the output."""
+        while True:
+            try:
+                kind, payload = job.messages.get_nowait()
+            except queue.Empty:
+                self.after(self.POLL_INTERVAL_MS, self._poll_attack, job, widget,
+                           run_button, cancel_button, progress, on_done)
+                return
+
+            if kind == 'progress':
+                done, total = payload
+                progress.config(value=done, maximum=total)
+                continue
+
+            if kind == 'done' and on_done is not None:
+                on_done(payload)
+            elif kind == 'done':
+                self._update_output(widget, payload, font=('monospace', 9))
+            elif kind == 'cancelled':
+                self._update_output(widget, "Attack cancelled.", font=('Inter', 10))
+            else:
+                self._update_output(widget, f"An error occurred during the attack: {payload}", font=('Inter', 10))
+
+            self.jobs.pop(widget, None)
+            run_button.config(state='normal')
+            cancel_button.config(state='disabled')
+            return
+
+    def _cancel_attack(self, widget):
+        """Handler for the Cancel buttons: asks the running job to stop."""
+        job = self.jobs.get(widget)
+        if job is not None:
+            job.cancel()
+
     def _handle_brute_force(self):
         """Handler for the Brute Force Crack button."""
         ciphertext = self.brute_force_input.get('1.0', tk.END).strip()
+        self.brute_force_table.delete(*self.brute_force_table.get_children())
         if not ciphertext:
             self._update_output(self.brute_force_output, "Please enter **ciphertext** in the input field above.", font=('Inter', 10))
             return
 
-        candidates = brute_force_crack(ciphertext)
-        
-        # Format output table
-        output = " Shift | Plaintext (First 70 Characters)\n"
-        output += "=" * 75 + "\n"
-        
-        for s, cand in candidates:
-            # Clean up newlines and limit/pad the text for uniform display
-            display_cand = cand.replace('\n', ' ') 
-            display_cand = display_cand[:70].ljust(70) 
-            output += f"  {s:02d}   | {display_cand}\n"
-            
-        self._update_output(self.brute_force_output, output, font=('monospace', 9))
+        # Only a fixed-length prefix is decrypted per shift, however large the input
+        self.brute_force_ciphertext = ciphertext
+        self._start_attack(brute_force_steps(ciphertext, self.BRUTE_FORCE_PREVIEW_LENGTH),
+                           self._format_brute_force_rows, self.brute_force_output,
+                           self.brute_force_run_button, self.brute_force_cancel_button,
+                           self.brute_force_progress, on_done=self._show_brute_force_rows)
+
+    def _format_brute_force_rows(self, candidates):
+        """Turns the brute force previews into (shift, display text) table rows."""
+        # Clean up newlines so each preview fits on one row
+        return [(s, cand.replace('\n', ' ')) for s, cand in candidates]
+
+    def _show_brute_force_rows(self, rows):
+        """Fills the candidate table with the preview rows."""
+        for s, display_cand in rows:
+            self.brute_force_table.insert('', tk.END, iid=str(s), values=(f"{s:02d}", display_cand))
+        self._update_output(self.brute_force_output, "Select a shift above to decrypt the full text.", font=('Inter', 10))
+
+    def _handle_brute_force_select(self, event):
+        """Decrypts the full ciphertext for the selected shift, only when it is requested."""
+        selection = self.brute_force_table.selection()
+        if not selection:
+            return
+        shift = int(selection[0])
+        plaintext = caesar_process_text(self.brute_force_ciphertext, -shift)
+        self._update_output(self.brute_force_output, plaintext, font=('Inter', 10))
 
     def _handle_frequency_analysis(self):
         """Handler for the Frequency Analysis Crack button."""
@@ -316,16 +742,22 @@ class CaesarCipherApp(tk.Tk):
             self._update_output(self.freq_analysis_output, "Please enter **ciphertext** in the input field above.", font=('Inter', 10))
             return
             
-        candidates = frequency_analysis_crack(ciphertext)
-        
-        # Format output for the top candidates
-        output = "Rank | Shift | Chi-Squared Score | Plaintext (First 55 Characters)\n"
+        # Only the best of the 5 displayed candidates is decrypted in full; the others only a preview
+        self._start_attack(rotation_frequency_steps(ciphertext, top_k=5, preview_length=self.FREQUENCY_PREVIEW_LENGTH),
+                           self._format_frequency_analysis,
+                           self.freq_analysis_output, self.freq_analysis_run_button,
+                           self.freq_analysis_cancel_button, self.freq_analysis_progress)
+
+    def _format_frequency_analysis(self, candidates):
+        """Formats the ranked frequency analysis candidates and the best prediction."""
+        preview_length = self.FREQUENCY_PREVIEW_LENGTH
+        output = f"Rank | Shift | Chi-Squared Score | Plaintext (First {preview_length} Characters)\n"
         output += "=" * 85 + "\n"
         
-        # Display the top 5 candidates
+        # Display the top 5 candidates (only the best one holds the full plaintext)
         for i, (s, cand, sc) in enumerate(candidates[:5]):
-            display_cand = cand.replace('\n', ' ')
-            display_cand = display_cand[:55].ljust(55) 
+            display_cand = cand[:preview_length].replace('\n', ' ')
+            display_cand = display_cand.ljust(preview_length)
             output += f" {i+1:^4} |  {s:02d}   | {sc:^16.6f} | {display_cand}\n"
         
         # Highlight the best candidate
@@ -336,10 +768,9 @@ class CaesarCipherApp(tk.Tk):
         output += f"Decryption Key (Shift): **{best_shift}**\n"
         output += f"Fitness Score (Chi-Squared): {best_score:.6f}\n"
         output += "\n--- Full Plaintext ---\n"
-        output += best_text
-
-        self._update_output(self.freq_analysis_output, output, font=('monospace', 9))
 
+        # One join copies the full plaintext once, instead of another full-size concatenation
+        return ''.join((output, best_text))
 
 if __name__ == "__main__":
     # Initialize and run the GUI application
@@ -0,0 +1,199 @@
+# benchmark.py
+# Reproducible benchmarks for the Caesar Cipher hot paths in "GUI Version.py":
+# caesar_process_text, brute_force_crack and frequency_analysis_crack
+# (plus the single-pass rotation_frequency_crack).
+# Usage: python benchmark.py [--sizes 1K 1M 100M] [--output results.json] [--compare old.json]
+
+import argparse
+import importlib.util
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+DEFAULT_SIZES = ['1K', '10K', '100K', '1M', '10M', '100M']
+CORPUS_SEED = 1337
+CORPUS_SHIFT = 3
+MIN_BENCH_TIME = 0.5 # Seconds each measurement keeps repeating for
+
+# Fixed vocabulary for the generated corpus (English-like letter distribution)
+VOCABULARY = (
+    "the of and to in is that it was for on are as with his they at be this from "
+    "have or by one had not but what all were when we there can an your which their "
+    "said if do will each about how up out them then she many some so these would "
+    "other into has more her two like him see time could no make than first been its "
+    "who now people my made over did down only way find use may water long little very "
+    "after words called just where most know get through back much before go good new "
+    "write our used me man too any day same right look think also around another came "
+    "come work three word must because does part even place well such here take why"
+).split()
+
+# --- Corpus ---
+
+def load_caesar_module():
+    """Imports "GUI Version.py" (the file name is not a valid module name)."""
+    spec = importlib.util.spec_from_file_location('caesar_gui', os.path.join(HERE, 'GUI Version.py'))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def parse_size(text):
+    """Parses sizes such as '512', '1K', '10M' or '1G' into a number of bytes."""
+    units = {'K': 1 << 10, 'M': 1 << 20, 'G': 1 << 30}
+    text = text.strip().upper().rstrip('B')
+    if text and text[-1] in units:
+        return int(float(text[:-1]) * units[text[-1]])
+    return int(text)
+
+def format_size(size):
+    """Formats a byte count the way parse_size reads it."""
+    for unit, factor in (('G', 1 << 30), ('M', 1 << 20), ('K', 1 << 10)):
+        if size >= factor and size % factor == 0:
+            return f"{size // factor}{unit}"
+    return str(size)
+
+def generate_corpus(size, seed=CORPUS_SEED):
+    """
+    Deterministic English-like plaintext of exactly 'size' characters. A 1 MiB block
+    is generated from a seeded RNG and repeated, so large corpora are cheap to build
+    and identical between runs and commits.
+    """
+    rng = random.Random(seed)
+    block_size = min(size, 1 << 20)
+    words = []
+    length = 0
+    while length < block_size:
+        word = rng.choice(VOCABULARY)
+        if rng.random() < 0.1:
+            word = word.capitalize()
+        if rng.random() < 0.08:
+            word += rng.choice('.,;!?')
+        if rng.random() < 0.02:
+            word += '\n'
+        words.append(word)
+        length += len(word) + 1
+    block = ' '.join(words)[:block_size]
+    return (block * (size // block_size + 1))[:size]
+
+# --- Measurement ---
+
+def measure(function, argument, min_time=MIN_BENCH_TIME):
+    """
+    Runs function(argument) until 'min_time' has elapsed (at least once) and then
+    once more under tracemalloc. Returns (repeats, elapsed seconds, peak bytes).
+    """
+    repeats = 0
+    start = time.perf_counter()
+    while True:
+        function(argument)
+        repeats += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+
+    # Peak memory is measured separately because tracemalloc slows everything down
+    tracemalloc.start()
+    function(argument)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return repeats, elapsed, peak
+
+def get_benchmarks(caesar):
+    """Returns (name, function, uses_ciphertext) for every benchmarked path."""
+    return [
+        ('caesar_process_text', lambda text: caesar.caesar_process_text(text, CORPUS_SHIFT), False),
+        ('brute_force_crack', caesar.brute_force_crack, True),
+        ('frequency_analysis_crack', caesar.frequency_analysis_crack, True),
+        ('rotation_frequency_crack', caesar.rotation_frequency_crack, True),
+    ]
+
+def get_commit():
+    """Returns the current git commit hash, or None outside a git checkout."""
+    try:
+        return subprocess.check_output(['git', 'rev-parse', 'HEAD'], cwd=HERE,
+                                       stderr=subprocess.DEVNULL, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def run_benchmarks(sizes, selected=None, min_time=MIN_BENCH_TIME):
+    """Runs every (selected) benchmark at every size and returns the JSON-ready report."""
+    caesar = load_caesar_module()
+    results = []
+
+    for size in sizes:
+        plaintext = generate_corpus(size)
+        ciphertext = caesar.caesar_process_text(plaintext, CORPUS_SHIFT)
+
+        for name, function, uses_ciphertext in get_benchmarks(caesar):
+            if selected and name not in selected:
+                continue
+            repeats, elapsed, peak = measure(function, ciphertext if uses_ciphertext else plaintext, min_time)
+            ops_per_sec = repeats / elapsed
+            result = {
+                'benchmark': name,
+                'size': format_size(size),
+                'size_bytes': size,
+                'repeats': repeats,
+                'seconds_per_op': elapsed / repeats,
+                'ops_per_sec': ops_per_sec,
+                'mb_per_sec': size * ops_per_sec / 1e6,
+                'peak_memory_bytes': peak,
+            }
+            results.append(result)
+            print(f"  {name:<26} {format_size(size):>6}  {ops_per_sec:12.2f} ops/s  "
+                  f"{result['mb_per_sec']:10.2f} MB/s  peak {peak / 1e6:10.2f} MB", flush=True)
+
+    return {
+        'metadata': {
+            'commit': get_commit(),
+            'python': sys.version.split()[0],
+            'platform': platform.platform(),
+            'corpus_seed': CORPUS_SEED,
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        },
+        'results': results,
+    }
+
+def compare_reports(old, new):
+    """Prints the MB/s speedup of each benchmark in 'new' relative to 'old'."""
+    previous = {(r['benchmark'], r['size_bytes']): r for r in old['results']}
+    print(f"\n--- COMPARISON (vs commit {old['metadata'].get('commit') or 'unknown'}) ---")
+    for r in new['results']:
+        before = previous.get((r['benchmark'], r['size_bytes']))
+        if before is None:
+            continue
+        speedup = r['mb_per_sec'] / before['mb_per_sec'] if before['mb_per_sec'] else float('inf')
+        memory = r['peak_memory_bytes'] / before['peak_memory_bytes'] if before['peak_memory_bytes'] else float('inf')
+        print(f"  {r['benchmark']:<26} {r['size']:>6}  speed x{speedup:7.2f}  peak memory x{memory:6.2f}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the Caesar Cipher encrypt, brute-force and frequency paths.")
+    parser.add_argument('--sizes', nargs='+', default=DEFAULT_SIZES, help="Input sizes, e.g. 1K 10M (default: 1K to 100M)")
+    parser.add_argument('--benchmarks', nargs='+', help="Only run these benchmarks")
+    parser.add_argument('--min-time', type=float, default=MIN_BENCH_TIME, help="Minimum seconds per measurement")
+    parser.add_argument('--output', help="Write the JSON results to this file")
+    parser.add_argument('--compare', help="Previous JSON results to compare against")
+    args = parser.parse_args()
+
+    sizes = [parse_size(s) for s in args.sizes]
+    print(f"--- CAESAR CIPHER BENCHMARKS (sizes: {', '.join(format_size(s) for s in sizes)}) ---")
+    report = run_benchmarks(sizes, args.benchmarks, args.min_time)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"\n  Results written to {args.output}")
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            compare_reports(json.load(f), report)
+
+if __name__ == '__main__':
+    main()
@@ -1,10 +1,43 @@
 import sys
+import os
+import math
+import time
+import argparse
 import string # Used for convenience
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+try:
+    import numpy as np
+except ImportError:
+    np = None # NumPy is optional; without it the per-character engine is used
 
 # --- 📚 VIGENERE CIPHER LOGIC AND CONSTANTS ---
 
 ALPHABET_SIZE = 26
 
+# Standard English letter frequencies (percentages), as in the other cipher tools
+EN_FREQ = {
+    'a': 8.167, 'b': 1.492, 'c': 2.782, 'd': 4.253, 'e': 12.702,
+    'f': 2.228, 'g': 2.015, 'h': 6.094, 'i': 6.966, 'j': 0.153,
+    'k': 0.772, 'l': 4.025, 'm': 2.406, 'n': 6.749, 'o': 7.507,
+    'p': 1.929, 'q': 0.095, 'r': 5.987, 's': 6.327, 't': 9.056,
+    'u': 2.758, 'v': 0.978, 'w': 2.360, 'x': 0.150, 'y': 1.974, 'z': 0.074
+}
+
+# Most common English bigrams (percentages); every other bigram gets BIGRAM_FLOOR
+EN_BIGRAMS = {
+    'th': 3.56, 'he': 3.07, 'in': 2.43, 'er': 2.05, 'an': 1.99, 're': 1.85, 'on': 1.76,
+    'at': 1.49, 'en': 1.45, 'nd': 1.35, 'ti': 1.34, 'es': 1.34, 'or': 1.28, 'te': 1.20,
+    'of': 1.17, 'ed': 1.17, 'is': 1.13, 'it': 1.12, 'al': 1.09, 'ar': 1.07, 'st': 1.05,
+    'to': 1.04, 'nt': 1.04, 'ng': 0.95, 'se': 0.93, 'ha': 0.93, 'as': 0.87, 'ou': 0.87,
+    'io': 0.83, 'le': 0.83, 've': 0.83, 'co': 0.79, 'me': 0.79, 'de': 0.76, 'hi': 0.76,
+    'ri': 0.73, 'ro': 0.73, 'ic': 0.70, 'ne': 0.69, 'ea': 0.69, 'ra': 0.69, 'ce': 0.65,
+    'li': 0.62, 'ch': 0.60, 'll': 0.58, 'be': 0.58, 'ma': 0.57, 'si': 0.55, 'om': 0.55,
+    'ur': 0.54
+}
+BIGRAM_FLOOR = 0.05
+
 def get_char_index(char):
     """Converts an alphabetic character (A-Z or a-z) to its 0-25 index."""
     char = char.upper()
@@ -41,13 +74,133 @@ def vigenere_shift_char(char, key_char, mode='encrypt'):
     is_upper = char.isupper()
     return get_index_char(new_index, is_upper)
 
+# --- Vectorized Cipher Engine (NumPy) ---
+
+VECTOR_BLOCK_SIZE = 1 << 20 # Characters per block, bounding the size of the temporary arrays
+
+if np is not None:
+    # For each ASCII code: its 0-25 letter index (-1 for non-letters) and whether it is upper case
+    ASCII_LETTER_INDEX = np.full(128, -1, dtype=np.int16)
+    ASCII_LETTER_INDEX[ord('A'):ord('Z') + 1] = np.arange(ALPHABET_SIZE)
+    ASCII_LETTER_INDEX[ord('a'):ord('z') + 1] = np.arange(ALPHABET_SIZE)
+    ASCII_IS_UPPER = np.zeros(128, dtype=bool)
+    ASCII_IS_UPPER[ord('A'):ord('Z') + 1] = True
+
+def keyword_shifts(keyword, mode='encrypt'):
+    """Converts a keyword into its list of shifts (0-25), negated for decryption."""
+    shifts = [get_char_index(char) for char in keyword.upper()]
+    if not shifts or None in shifts:
+        raise ValueError("Keyword must be non-empty and contain only letters A-Z.")
+    if mode != 'encrypt':
+        shifts = [-shift % ALPHABET_SIZE for shift in shifts]
+    return shifts
+
+# Number of compiled keywords kept by compile_keyword (services reuse only a few)
+KEYWORD_CACHE_SIZE = 32
+
+@lru_cache(maxsize=KEYWORD_CACHE_SIZE)
+def compile_keyword(keyword, mode='encrypt'):
+    """Returns the shifts of a keyword as a tuple, reusing recently compiled keywords."""
+    return tuple(keyword_shifts(keyword, mode))
+
+def classify_codes(codes):
+    """
+    Classifies an array of code points exactly like vigenere_process_text does per character.
+    Returns (advances, letter_index, is_upper): whether the character consumes a keyword
+    letter (isalpha), its 0-25 index (-1 if it is not shifted) and its case.
+    """
+    if codes.dtype == np.uint8:
+        letter_index = ASCII_LETTER_INDEX[codes]
+        return letter_index >= 0, letter_index, ASCII_IS_UPPER[codes]
+
+    letter_index = np.full(len(codes), -1, dtype=np.int16)
+    is_upper = np.zeros(len(codes), dtype=bool)
+    advances = np.zeros(len(codes), dtype=bool)
+
+    ascii_mask = codes < 128
+    ascii_codes = codes[ascii_mask]
+    letter_index[ascii_mask] = ASCII_LETTER_INDEX[ascii_codes]
+    is_upper[ascii_mask] = ASCII_IS_UPPER[ascii_codes]
+    advances[ascii_mask] = letter_index[ascii_mask] >= 0
+
+    # Each distinct non-ASCII character is classified once with the scalar helpers
+    other_mask = ~ascii_mask
+    if other_mask.any():
+        unique_codes, inverse = np.unique(codes[other_mask], return_inverse=True)
+        chars = [chr(code) for code in unique_codes.tolist()]
+        unique_advances = np.array([char.isalpha() for char in chars], dtype=bool)
+        unique_index = np.array([get_char_index(char) if char.isalpha() and get_char_index(char) is not None else -1
+                                 for char in chars], dtype=np.int16)
+        unique_upper = np.array([char.isupper() for char in chars], dtype=bool)
+        advances[other_mask] = unique_advances[inverse]
+        letter_index[other_mask] = unique_index[inverse]
+        is_upper[other_mask] = unique_upper[inverse]
+
+    return advances, letter_index, is_upper
+
+def vigenere_transform_codes(codes, shifts, key_offset=0, message_lengths=None):
+    """
+    Applies the Vigenère shifts to an array of code points in one array operation.
+    Each letter's keyword position is the running count of alphabetic characters
+    (a cumulative sum of the mask), offset by 'key_offset' letters already processed.
+    With 'message_lengths', the codes are several messages packed end to end and the
+    keyword restarts at the beginning of each one.
+    Returns the transformed codes and the number of keyword letters consumed.
+    """
+    advances, letter_index, is_upper = classify_codes(codes)
+    letter_count = np.cumsum(advances)
+    consumed = int(letter_count[-1]) if len(codes) else 0
+    if message_lengths is not None:
+        # Subtract the letters of all previous messages from every position of a message
+        starts = np.cumsum(message_lengths) - message_lengths
+        letters_before = np.concatenate(([0], letter_count))[starts]
+        letter_count = letter_count - np.repeat(letters_before, message_lengths)
+
+    shift_table = np.asarray(shifts, dtype=np.int64)
+    key_position = (letter_count - 1 + key_offset) % len(shift_table)
+    new_index = (letter_index + shift_table[key_position]) % ALPHABET_SIZE
+    new_codes = np.where(is_upper, ord('A'), ord('a')) + new_index
+
+    shifted = letter_index >= 0
+    result = codes.copy()
+    result[shifted] = new_codes[shifted]
+    return result, consumed
+
+def vigenere_transform_block(text, shifts, key_offset=0):
+    """Transforms one block of text; returns the new text and the keyword letters consumed."""
+    if text.isascii():
+        codes = np.frombuffer(text.encode('ascii'), dtype=np.uint8)
+        result, consumed = vigenere_transform_codes(codes, shifts, key_offset)
+        return result.tobytes().decode('ascii'), consumed
+
+    codes = np.frombuffer(text.encode('utf-32-le', 'surrogatepass'), dtype=np.uint32)
+    result, consumed = vigenere_transform_codes(codes, shifts, key_offset)
+    return result.tobytes().decode('utf-32-le', 'surrogatepass'), consumed
+
+def vigenere_process_vectorized(text, keyword, mode='encrypt'):
+    """
+    NumPy implementation of vigenere_process_text with identical output. The text is
+    processed in blocks, carrying the keyword position from one block to the next.
+    """
+    shifts = compile_keyword(keyword, mode)
+    pieces = []
+    key_offset = 0
+    for start in range(0, len(text), VECTOR_BLOCK_SIZE):
+        piece, consumed = vigenere_transform_block(text[start:start + VECTOR_BLOCK_SIZE], shifts, key_offset)
+        pieces.append(piece)
+        key_offset = (key_offset + consumed) % len(shifts)
+    return ''.join(pieces)
+
 # --- Core Cipher Logic ---
 
 def vigenere_process_text(text, keyword, mode='encrypt'):
     """
     Encrypts or decrypts text using the Vigenère Cipher.
     The keyword is repeated to match the length of the plaintext.
+    Uses the vectorized engine when NumPy is installed.
     """
+    if np is not None:
+        return vigenere_process_vectorized(text, keyword, mode)
     
     keyword = keyword.upper()
     keyword_len = len(keyword)
@@ -80,6 +233,601 @@ def vigenere_decrypt(ciphertext, keyword):
     """Decrypts ciphertext using the Vigenère Cipher."""
     return vigenere_process_text(ciphertext, keyword, mode='decrypt')
 
+# --- Streaming Cipher ---
+
+STREAM_CHUNK_SIZE = 1 << 20 # Characters read per chunk in pipe mode
+
+class VigenereStream:
+    """
+    Stateful Vigenère encoder/decoder for text that arrives in chunks.
+    The keyword position is carried between feed() calls, so feeding a text in
+    any number of pieces gives exactly the same output as one vigenere_process_text call.
+    """
+
+    def __init__(self, keyword, mode='encrypt'):
+        self.keyword = keyword.upper()
+        self.mode = mode
+        self.shifts = compile_keyword(keyword, mode)
+        self.key_offset = 0 # Position within the keyword of the next alphabetic character
+
+    def feed(self, chunk):
+        """Encrypts or decrypts the next chunk of text and returns the result."""
+        if np is not None:
+            result, consumed = vigenere_transform_block(chunk, self.shifts, self.key_offset)
+            self.key_offset = (self.key_offset + consumed) % len(self.shifts)
+            return result
+
+        processed_text = []
+        for char in chunk:
+            if char.isalpha():
+                key_char = self.keyword[self.key_offset]
+                processed_text.append(vigenere_shift_char(char, key_char, self.mode))
+                self.key_offset = (self.key_offset + 1) % len(self.keyword)
+            else:
+                processed_text.append(char)
+        return ''.join(processed_text)
+
+def vigenere_stream(source, sink, keyword, mode='encrypt', chunk_size=STREAM_CHUNK_SIZE):
+    """
+    Encrypts or decrypts a text stream chunk by chunk with bounded memory.
+    Returns the number of characters processed.
+    """
+    stream = VigenereStream(keyword, mode)
+    processed = 0
+    while True:
+        chunk = source.read(chunk_size)
+        if not chunk:
+            break
+        sink.write(stream.feed(chunk))
+        processed += len(chunk)
+    return processed
+
+def open_text_stream(path, mode):
+    """
+    Opens a UTF-8 text file, or stdin/stdout for '-'. Newlines are left untranslated and
+    undecodable bytes are passed through unchanged (surrogateescape).
+    """
+    if path == '-':
+        return open((sys.stdin if mode == 'r' else sys.stdout).fileno(), mode, encoding='utf-8',
+                    errors='surrogateescape', newline='', closefd=False)
+    return open(path, mode, encoding='utf-8', errors='surrogateescape', newline='')
+
+# --- Batch Processing ---
+
+BATCH_TASK_SIZE = 512 # Messages handed to a pool worker at a time
+
+def vigenere_shift_message(text, shifts):
+    """Per-character transform of one message with precompiled shifts (used without NumPy)."""
+    processed_text = []
+    key_index = 0
+    for char in text:
+        if char.isalpha():
+            char_index = get_char_index(char)
+            if char_index is not None:
+                char = get_index_char(char_index + shifts[key_index % len(shifts)], char.isupper())
+            key_index += 1
+        processed_text.append(char)
+    return ''.join(processed_text)
+
+def vigenere_process_group(messages, shifts):
+    """
+    Transforms messages that share a keyword. With NumPy they are packed into one array
+    and processed in a single pass, restarting the keyword at each message boundary.
+    """
+    if np is None:
+        return [vigenere_shift_message(message, shifts) for message in messages]
+
+    joined = ''.join(messages)
+    if not joined:
+        return list(messages)
+    lengths = np.array([len(message) for message in messages], dtype=np.int64)
+    if joined.isascii():
+        codes = np.frombuffer(joined.encode('ascii'), dtype=np.uint8)
+        result, _ = vigenere_transform_codes(codes, shifts, message_lengths=lengths)
+        joined = result.tobytes().decode('ascii')
+    else:
+        codes = np.frombuffer(joined.encode('utf-32-le', 'surrogatepass'), dtype=np.uint32)
+        result, _ = vigenere_transform_codes(codes, shifts, message_lengths=lengths)
+        joined = result.tobytes().decode('utf-32-le', 'surrogatepass')
+
+    ends = np.cumsum(lengths).tolist()
+    return [joined[end - len(message):end] for message, end in zip(messages, ends)]
+
+def vigenere_batch_task(messages, keywords, mode='encrypt'):
+    """Processes one slice of a batch, grouping the messages by keyword."""
+    results = [None] * len(messages)
+    groups = {}
+    for index, keyword in enumerate(keywords):
+        groups.setdefault(keyword, []).append(index)
+    for keyword, indices in groups.items():
+        processed = vigenere_process_group([messages[index] for index in indices], compile_keyword(keyword, mode))
+        for index, text in zip(indices, processed):
+            results[index] = text
+    return results
+
+def vigenere_process_batch(messages, keywords, mode='encrypt', executor=None, workers=None):
+    """
+    Encrypts or decrypts many messages in one call. 'keywords' is one keyword for all
+    messages or a list with one per message. Each keyword is compiled once (and cached);
+    'executor' may be 'thread' or 'process' to fan slices of the batch out over a pool.
+    Returns the results in input order.
+    """
+    messages = list(messages)
+    if isinstance(keywords, str):
+        keywords = [keywords] * len(messages)
+    else:
+        keywords = list(keywords)
+        if len(keywords) != len(messages):
+            raise ValueError("Provide one keyword, or exactly one keyword per message.")
+    if executor not in (None, 'thread', 'process'):
+        raise ValueError("executor must be None, 'thread' or 'process'.")
+    # Validate every keyword up front so that a worker never fails halfway through
+    for keyword in set(keywords):
+        compile_keyword(keyword, mode)
+
+    if executor is None or len(messages) <= BATCH_TASK_SIZE:
+        return vigenere_batch_task(messages, keywords, mode)
+
+    starts = range(0, len(messages), BATCH_TASK_SIZE)
+    pool_class = ThreadPoolExecutor if executor == 'thread' else ProcessPoolExecutor
+    with pool_class(max_workers=workers) as pool:
+        slices = pool.map(vigenere_batch_task,
+                          [messages[start:start + BATCH_TASK_SIZE] for start in starts],
+                          [keywords[start:start + BATCH_TASK_SIZE] for start in starts],
+                          [mode] * len(starts))
+        return [text for batch in slices for text in batch]
+
+# --- Cryptanalysis: Kasiski Examination ---
+
+KASISKI_MIN_NGRAM = 3
+KASISKI_MAX_NGRAM = 5
+MAX_KEY_LENGTH = 20
+NGRAM_BASE = ALPHABET_SIZE + 1 # Letter values 0-25, plus 26 for non-ASCII letters
+
+def ciphertext_letter_values(ciphertext):
+    """
+    Returns the 0-25 value of every character that advances the keyword (isalpha),
+    so that list positions match keyword positions. Non-ASCII letters get the value 26.
+    """
+    values = []
+    for char in ciphertext:
+        if char.isalpha():
+            index = get_char_index(char)
+            values.append(ALPHABET_SIZE if index is None else index)
+    return values
+
+def ngram_repeat_distances(values, n):
+    """
+    Finds every repeated n-gram with a rolling hash and returns the distances between
+    consecutive occurrences. The hash is the exact base-27 value of the n-gram, updated
+    in constant time per position, so the index is built in one linear pass.
+    """
+    if len(values) < n:
+        return []
+    leading_weight = NGRAM_BASE ** (n - 1)
+    ngram_hash = 0
+    for value in values[:n]:
+        ngram_hash = ngram_hash * NGRAM_BASE + value
+
+    last_seen = {ngram_hash: 0}
+    distances = []
+    for position in range(1, len(values) - n + 1):
+        ngram_hash = (ngram_hash - values[position - 1] * leading_weight) * NGRAM_BASE + values[position + n - 1]
+        previous = last_seen.get(ngram_hash)
+        if previous is not None:
+            distances.append(position - previous)
+        last_seen[ngram_hash] = position
+    return distances
+
+def kasiski_examination(ciphertext, max_ngram=KASISKI_MAX_NGRAM, max_key_length=MAX_KEY_LENGTH):
+    """
+    Kasiski test: collects the distances between repeated n-grams (n = 3..max_ngram),
+    builds a histogram of their factors (2..max_key_length) and ranks the key lengths.
+    A key length is scored by how much more often it divides the distances than chance
+    (1/length), which stops small factors like 2 and 3 from dominating.
+    Returns (ranking, distance_count): ranking is a list of (length, count, score), best first.
+    """
+    values = ciphertext_letter_values(ciphertext)
+    distance_counts = Counter()
+    for n in range(KASISKI_MIN_NGRAM, max_ngram + 1):
+        distance_counts.update(ngram_repeat_distances(values, n))
+
+    total = sum(distance_counts.values())
+    if total == 0:
+        return [], 0
+
+    factor_counts = Counter()
+    for distance, count in distance_counts.items():
+        for length in range(2, min(distance, max_key_length) + 1):
+            if distance % length == 0:
+                factor_counts[length] += count
+
+    ranking = [(length, factor_counts[length], factor_counts[length] / total - 1 / length)
+               for length in range(2, max_key_length + 1)]
+    ranking.sort(key=lambda item: (-item[2], item[0]))
+    return ranking, total
+
+# --- Cryptanalysis: Index of Coincidence ---
+
+ENGLISH_IOC = 0.0667 # Index of coincidence of English text
+RANDOM_IOC = 1 / ALPHABET_SIZE # Index of coincidence of uniformly random letters
+IOC_BLOCK_SIZE = 1 << 16 # Letters counted per bincount, bounding memory to max_period * block
+IOC_DIVISOR_RATIO = 0.9 # A period is ranked after its divisors if one reaches this share of its IoC
+
+def letter_index_array(text, with_positions=False):
+    """
+    NumPy letters-only projection of a text: one entry per character that advances the
+    keyword (isalpha), holding its 0-25 index (-1 for non-ASCII letters).
+    With 'with_positions', also returns the character offset of each entry in the text.
+    """
+    if text.isascii():
+        codes = np.frombuffer(text.encode('ascii'), dtype=np.uint8)
+    else:
+        codes = np.frombuffer(text.encode('utf-32-le', 'surrogatepass'), dtype=np.uint32)
+    advances, letter_index, _ = classify_codes(codes)
+    letters = letter_index[advances].astype(np.int64)
+    if with_positions:
+        return letters, np.flatnonzero(advances)
+    return letters
+
+def column_letter_counts(letters, max_period, start_position=0):
+    """
+    Counts the letters of every column for every period 1..max_period in one pass.
+    Each (period, column, letter) triple gets its own bin, so each block of letters is
+    counted for all periods with a single bincount. 'start_position' is the keyword
+    position of the first letter, for letters that continue an earlier text.
+    Returns a list where entry p - 1 is a (p, 26) count matrix.
+    """
+    periods = np.arange(1, max_period + 1)
+    # Bin layout: all columns of period 1, then of period 2, ... each with 27 letter slots
+    period_offsets = np.concatenate(([0], np.cumsum(periods)[:-1])) * (ALPHABET_SIZE + 1)
+    total_bins = int(periods.sum()) * (ALPHABET_SIZE + 1)
+    values = np.where(letters >= 0, letters, ALPHABET_SIZE) # Slot 26 collects non-ASCII letters
+
+    counts = np.zeros(total_bins, dtype=np.int64)
+    for start in range(0, len(letters), IOC_BLOCK_SIZE):
+        positions = np.arange(start, min(start + IOC_BLOCK_SIZE, len(letters)))
+        columns = (positions[None, :] + start_position) % periods[:, None]
+        bins = period_offsets[:, None] + columns * (ALPHABET_SIZE + 1) + values[None, start:start + len(positions)]
+        counts += np.bincount(bins.ravel(), minlength=total_bins)
+
+    matrices = []
+    for period, offset in zip(periods.tolist(), period_offsets.tolist()):
+        block = counts[offset:offset + period * (ALPHABET_SIZE + 1)].reshape(period, ALPHABET_SIZE + 1)
+        matrices.append(block[:, :ALPHABET_SIZE])
+    return matrices
+
+def average_ioc(counts):
+    """Average index of coincidence of the columns of a (period, 26) count matrix."""
+    totals = counts.sum(axis=1)
+    valid = totals > 1
+    if not valid.any():
+        return 0.0
+    coincidences = (counts * (counts - 1)).sum(axis=1)
+    return float((coincidences[valid] / (totals[valid] * (totals[valid] - 1))).mean())
+
+def rank_periods(iocs):
+    """
+    Ranks periods 1..len(iocs) by IoC. A period is moved behind the others when one of
+    its divisors already reaches IOC_DIVISOR_RATIO of its IoC (it is then a multiple of
+    the keyword length rather than the length itself).
+    Returns a list of (period, ioc), best candidate first.
+    """
+    def is_multiple(period):
+        ioc = iocs[period - 1]
+        return any(period % divisor == 0 and iocs[divisor - 1] >= IOC_DIVISOR_RATIO * ioc
+                   for divisor in range(1, period))
+
+    ranking = [(period, ioc) for period, ioc in enumerate(iocs, start=1)]
+    ranking.sort(key=lambda item: (is_multiple(item[0]), -item[1], item[0]))
+    return ranking
+
+def ioc_period_scan(ciphertext, max_period=MAX_KEY_LENGTH):
+    """
+    Computes the average index of coincidence for every keyword length 1..max_period.
+    At the right period (and its multiples) every column is a Caesar cipher, so the
+    IoC rises from RANDOM_IOC towards ENGLISH_IOC. Multiples of the keyword length
+    score as well as the length itself, so a period is moved behind the others when
+    one of its divisors already explains its IoC.
+    Returns a list of (period, ioc), best candidate first.
+    """
+    if np is None:
+        raise ImportError("ioc_period_scan requires the NumPy library (pip install numpy).")
+
+    letters = letter_index_array(ciphertext)
+    max_period = max(1, min(max_period, len(letters) // 2))
+    matrices = column_letter_counts(letters, max_period)
+    return rank_periods([average_ioc(counts) for counts in matrices])
+
+# --- Cryptanalysis: FFT Autocorrelation ---
+
+def autocorrelation_coincidences(letters):
+    """
+    Counts, for every shift offset k, how many positions t have letters[t] == letters[t + k].
+    Each letter's one-hot indicator is autocorrelated through its power spectrum (zero-padded
+    to avoid wrap-around) and the 26 spectra are summed before a single inverse FFT, so all
+    offsets cost O(n log n) instead of O(n^2). Non-ASCII letters (-1) never coincide.
+    Returns an int64 array indexed by offset (0..n-1).
+    """
+    n = len(letters)
+    if n == 0:
+        return np.zeros(0, dtype=np.int64)
+    size = 1 << (2 * n - 1).bit_length() # Power of two >= 2n - 1
+    power = np.zeros(size // 2 + 1)
+    indicator = np.zeros(n)
+    for letter in range(ALPHABET_SIZE):
+        np.equal(letters, letter, out=indicator, casting='unsafe')
+        spectrum = np.fft.rfft(indicator, size)
+        power += spectrum.real ** 2 + spectrum.imag ** 2
+    correlation = np.fft.irfft(power, size)[:n]
+    return np.rint(correlation).astype(np.int64)
+
+def fft_key_length_scan(ciphertext, max_period=MAX_KEY_LENGTH):
+    """
+    Key-length estimate from the autocorrelation of the letters-only ciphertext. Offsets
+    that are multiples of the keyword length compare letters enciphered with the same
+    shift, so their coincidence rate peaks near ENGLISH_IOC while other offsets stay near
+    RANDOM_IOC. Each length is scored by the pooled rate over all of its multiples up to
+    n / 2, which keeps a signal even when Kasiski repeats are sparse.
+    Returns a list of (length, rate), best candidate first (multiples ranked after divisors).
+    """
+    if np is None:
+        raise ImportError("fft_key_length_scan requires the NumPy library (pip install numpy).")
+
+    letters = letter_index_array(ciphertext)
+    n = len(letters)
+    max_lag = n // 2
+    if max_lag < 1:
+        return []
+    coincidences = autocorrelation_coincidences(letters)
+    overlaps = n - np.arange(n) # Number of compared pairs at each offset
+
+    rates = []
+    for length in range(1, min(max_period, max_lag) + 1):
+        lags = np.arange(length, max_lag + 1, length)
+        rates.append(float(coincidences[lags].sum() / overlaps[lags].sum()))
+
+    def is_multiple(length):
+        excess = rates[length - 1] - RANDOM_IOC
+        return any(length % divisor == 0 and rates[divisor - 1] - RANDOM_IOC >= IOC_DIVISOR_RATIO * excess
+                   for divisor in range(1, length))
+
+    ranking = [(length, rate) for length, rate in enumerate(rates, start=1)]
+    ranking.sort(key=lambda item: (is_multiple(item[0]), -item[1], item[0]))
+    return ranking
+
+# --- Cryptanalysis: Ciphertext-Only Cracker ---
+
+CRACK_MAX_PERIOD = 40
+CRACK_CANDIDATE_PERIODS = 6
+
+# log10 probability of every bigram of letter values, indexed by first * 27 + second.
+# Value 26 (a non-ASCII letter) contributes nothing.
+BIGRAM_LOG_TABLE = [0.0] * (ALPHABET_SIZE + 1) ** 2
+for first in range(ALPHABET_SIZE):
+    for second in range(ALPHABET_SIZE):
+        bigram = string.ascii_lowercase[first] + string.ascii_lowercase[second]
+        BIGRAM_LOG_TABLE[first * (ALPHABET_SIZE + 1) + second] = math.log10(EN_BIGRAMS.get(bigram, BIGRAM_FLOOR) / 100)
+
+def solve_column_shift(letter_counts, freq_table=EN_FREQ):
+    """
+    Solves one Caesar column: the shift whose rotation of the count vector best matches
+    English (Chi-squared). With shift s the plaintext count of letter p is the ciphertext
+    count of (p + s) mod 26, so nothing has to be decrypted.
+    """
+    total = sum(letter_counts)
+    if not total:
+        return 0
+    expected = [freq_table[ch] * total / 100.0 for ch in string.ascii_lowercase]
+    scores = [sum((letter_counts[(p + shift) % ALPHABET_SIZE] - expected_count) ** 2 / expected_count
+                  for p, expected_count in enumerate(expected))
+              for shift in range(ALPHABET_SIZE)]
+    return scores.index(min(scores))
+
+def bigram_fitness(values):
+    """Average log10 English bigram probability of a bytes object of letter values (higher is better)."""
+    if len(values) < 2:
+        return float('-inf')
+    stride = ALPHABET_SIZE + 1
+    return sum(BIGRAM_LOG_TABLE[a * stride + b] for a, b in zip(values, values[1:])) / (len(values) - 1)
+
+def minimal_keyword(keyword):
+    """Reduces a repeated keyword to its shortest period (e.g. LEMONLEMON -> LEMON)."""
+    for length in range(1, len(keyword)):
+        if len(keyword) % length == 0 and keyword == keyword[:length] * (len(keyword) // length):
+            return keyword[:length]
+    return keyword
+
+def crack_period(values, period):
+    """
+    Recovers the keyword for one candidate period from a bytes object of letter values.
+    Every column is counted with bytes.count and solved independently; the columns are
+    then decrypted with bytes.translate to score the whole plaintext.
+    Returns (keyword, fitness, period).
+    """
+    plaintext = bytearray(len(values))
+    keyword = []
+    for column in range(period):
+        column_values = values[column::period]
+        shift = solve_column_shift([column_values.count(value) for value in range(ALPHABET_SIZE)])
+        table = bytes([(value - shift) % ALPHABET_SIZE for value in range(ALPHABET_SIZE)] + list(range(ALPHABET_SIZE, 256)))
+        plaintext[column::period] = column_values.translate(table)
+        keyword.append(chr(ord('A') + shift))
+    return ''.join(keyword), bigram_fitness(plaintext), period
+
+def candidate_periods(ciphertext, count=CRACK_CANDIDATE_PERIODS, max_period=CRACK_MAX_PERIOD):
+    """Most likely keyword lengths: the IoC scan with NumPy, otherwise the Kasiski test."""
+    if np is not None:
+        ranking = ioc_period_scan(ciphertext, max_period)
+    else:
+        ranking = kasiski_examination(ciphertext, max_key_length=max_period)[0] or [(1, 0, 0)]
+    return [item[0] for item in ranking[:count]]
+
+def vigenere_crack(ciphertext, periods=None, workers=1):
+    """
+    Ciphertext-only attack. Each candidate period is split into Caesar columns solved by
+    count rotation, and the resulting keywords are ranked by bigram fitness. Periods are
+    evaluated in parallel across a process pool when 'workers' is more than one (the
+    default runs in-process, which also works when this file is loaded via importlib).
+    Returns a list of (keyword, fitness, period), best first, with distinct keywords;
+    the list is empty when there are too few letters to score any keyword.
+    """
+    values = bytes(ciphertext_letter_values(ciphertext))
+    if not values:
+        return []
+    if periods is None:
+        periods = candidate_periods(ciphertext)
+    periods = [period for period in periods if 1 <= period <= max(1, len(values))]
+
+    if workers > 1 and len(periods) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(periods))) as pool:
+            results = list(pool.map(crack_period, [values] * len(periods), periods))
+    else:
+        results = [crack_period(values, period) for period in periods]
+
+    ranking = []
+    seen = set()
+    for keyword, fitness, period in sorted(results, key=lambda item: (-item[1], item[2])):
+        if fitness == float('-inf'):
+            continue # Fewer than two letters: nothing to score
+        keyword = minimal_keyword(keyword)
+        if keyword not in seen:
+            seen.add(keyword)
+            ranking.append((keyword, fitness, period))
+    return ranking
+
+# --- Cryptanalysis: Crib Dragging ---
+
+CRIB_BLOCK_SIZE = 1 << 16 # Offsets scored per array operation, bounding memory to block * crib length
+CRIB_MIN_OVERLAP = 3 # A key period must be checked on at least this many letter pairs
+CRIB_PERIODICITY_WEIGHT = 2.0 # Weight of a fully periodic key fragment against its bigram fitness
+
+def score_key_fragments(keys):
+    """
+    Scores an (m, windows) array of implied key fragments, one row per crib letter so that
+    every comparison runs over contiguous memory. Periodicity is the largest number of
+    positions that repeat at some period p (keys[i] == keys[i + p], checked on at least
+    CRIB_MIN_OVERLAP pairs) relative to the crib length: a crib longer than the keyword
+    implies a key that repeats exactly. Word-likeness is the average English bigram log probability of the fragment,
+    since keywords are usually words. The score combines both (higher is better).
+    """
+    m, count = keys.shape
+    repeats = np.zeros(count, dtype=np.int32)
+    matches = np.zeros(count, dtype=np.int32)
+    for period in range(1, m - CRIB_MIN_OVERLAP + 1):
+        matches[:] = 0
+        for i in range(m - period):
+            matches += keys[i] == keys[i + period]
+        np.maximum(repeats, matches, out=repeats)
+
+    bigram_table = np.array(BIGRAM_LOG_TABLE)
+    fitness = np.zeros(count)
+    for i in range(m - 1):
+        fitness += bigram_table[keys[i].astype(np.int16) * (ALPHABET_SIZE + 1) + keys[i + 1]]
+    return fitness / (m - 1) + CRIB_PERIODICITY_WEIGHT * repeats / m
+
+def vigenere_crib_drag(ciphertext, crib, top_k=10):
+    """
+    Slides a probable plaintext word across every offset of the letters-only ciphertext.
+    The implied key fragment at every offset is computed in one array operation over a
+    sliding-window view ((ciphertext - crib) mod 26), and the offsets are ranked by
+    score_key_fragments. Windows containing non-ASCII letters are skipped.
+    Returns a list of (text_offset, key_fragment, score), best first.
+    """
+    if np is None:
+        raise ImportError("vigenere_crib_drag requires the NumPy library (pip install numpy).")
+
+    crib_values = [get_char_index(char) for char in crib if char.isalpha()]
+    if len(crib_values) < 2 or None in crib_values:
+        raise ValueError("Crib must contain at least two letters A-Z.")
+
+    letters, positions = letter_index_array(ciphertext, with_positions=True)
+    m = len(crib_values)
+    if len(letters) < m:
+        return []
+    windows = np.lib.stride_tricks.sliding_window_view(letters.astype(np.int8), m)
+    crib_array = np.array(crib_values, dtype=np.int8)
+
+    best_offsets = np.zeros(0, dtype=np.int64)
+    best_scores = np.zeros(0)
+    for start in range(0, len(windows), CRIB_BLOCK_SIZE):
+        block = windows[start:start + CRIB_BLOCK_SIZE]
+        keys = (block - crib_array) % ALPHABET_SIZE
+        scores = score_key_fragments(np.ascontiguousarray(keys.T))
+        scores[(block < 0).any(axis=1)] = -np.inf
+
+        # Keep only the best top_k of the block, then of the running selection
+        keep = np.argpartition(-scores, min(top_k, len(scores)) - 1)[:top_k]
+        best_offsets = np.concatenate((best_offsets, keep + start))
+        best_scores = np.concatenate((best_scores, scores[keep]))
+        keep = np.argpartition(-best_scores, min(top_k, len(best_scores)) - 1)[:top_k]
+        best_offsets, best_scores = best_offsets[keep], best_scores[keep]
+
+    order = np.lexsort((best_offsets, -best_scores))
+    results = []
+    for index in order:
+        if not np.isfinite(best_scores[index]):
+            continue
+        offset = int(best_offsets[index])
+        key = ''.join(chr(ord('A') + value) for value in ((windows[offset] - crib_array) % ALPHABET_SIZE).tolist())
+        results.append((int(positions[offset]), key, float(best_scores[index])))
+    return results
+
+# --- Cryptanalysis: Incremental Statistics ---
+
+class VigenereStatistics:
+    """
+    Running cryptanalysis statistics for ciphertext that arrives in pieces.
+    Keeps the letter counts of every column for every period 1..max_period; feed()
+    only counts the new chunk, continuing the keyword position of the letters-only
+    projection (every isalpha character) from the previous chunks. The IoC ranking
+    and the column shifts can be queried at any moment without recounting.
+    """
+
+    def __init__(self, max_period=CRACK_MAX_PERIOD):
+        if np is None:
+            raise ImportError("VigenereStatistics requires the NumPy library (pip install numpy).")
+        self.max_period = max_period
+        self.letter_count = 0 # Letters seen so far, i.e. the keyword position of the next one
+        self.counts = [np.zeros((period, ALPHABET_SIZE), dtype=np.int64) for period in range(1, max_period + 1)]
+
+    def feed(self, chunk):
+        """Adds the next chunk of ciphertext to the counts."""
+        letters = letter_index_array(chunk)
+        if not len(letters):
+            return
+        for total, new in zip(self.counts, column_letter_counts(letters, self.max_period, self.letter_count)):
+            total += new
+        self.letter_count += len(letters)
+
+    def ioc(self, period):
+        """Average index of coincidence of the columns for one period."""
+        return average_ioc(self.counts[period - 1])
+
+    def period_ranking(self):
+        """Ranks the periods with enough letters (two per column) like ioc_period_scan."""
+        usable = max(1, min(self.max_period, self.letter_count // 2))
+        return rank_periods([self.ioc(period) for period in range(1, usable + 1)])
+
+    def column_shifts(self, period):
+        """Current best shift (0-25) of every column for one period."""
+        return [solve_column_shift(column.tolist()) for column in self.counts[period - 1]]
+
+    def keyword(self, period):
+        """Current keyword estimate for one period."""
+        return ''.join(chr(ord('A') + shift) for shift in self.column_shifts(period))
+
+    def keyword_candidates(self, count=CRACK_CANDIDATE_PERIODS):
+        """Distinct keyword estimates for the best periods: a list of (period, ioc, keyword)."""
+        candidates = []
+        seen = set()
+        for period, ioc in self.period_ranking()[:count]:
+            keyword = minimal_keyword(self.keyword(period))
+            if keyword not in seen:
+                seen.add(keyword)
+                candidates.append((period, ioc, keyword))
+        return candidates
+
 
 # --- Helper Functions (Input Validation) ---
 
@@ -122,6 +870,66 @@ def run_decryption_mode():
     print(f"  Keyword:    {keyword.upper()}")
     print(f"  Decrypted:  {decrypted_text}\n")
 
+def run_kasiski_mode():
+    """Handles the user interaction for the Kasiski examination (keyword length search)."""
+    print("\n--- KASISKI EXAMINATION ---")
+    ciphertext = input("  Enter Ciphertext to analyze: ")
+
+    ranking, distance_count = kasiski_examination(ciphertext)
+    if not ranking:
+        print("\n  No repeated letter groups found. The ciphertext is too short for the Kasiski test.")
+    else:
+        print(f"\n--- RESULT ({distance_count} repeat distances) ---")
+        for length, count, score in ranking[:5]:
+            print(f"  Key length {length:2}: divides {count} distances (score {score:+.3f})")
+        print(f"\n  Most likely keyword length: {ranking[0][0]}")
+
+    # The autocorrelation estimate needs no repeats, so it also covers short ciphertexts
+    if np is not None:
+        fft_ranking = fft_key_length_scan(ciphertext)
+        if fft_ranking:
+            length, rate = fft_ranking[0]
+            print(f"  Autocorrelation (FFT) estimate: {length} (coincidence rate {rate:.4f})")
+    print()
+
+def run_crack_keyword_mode():
+    """Handles the user interaction for the ciphertext-only keyword recovery."""
+    print("\n--- CRACK KEYWORD (CIPHERTEXT ONLY) ---")
+    ciphertext = input("  Enter Ciphertext to crack: ")
+
+    ranking = vigenere_crack(ciphertext, workers=os.cpu_count() or 1)
+    if not ranking:
+        print("\n  The ciphertext has too few letters, so there is nothing to analyze.\n")
+        return
+
+    print("\n--- CANDIDATE KEYWORDS ---")
+    for keyword, fitness, period in ranking:
+        print(f"  Period {period:2}: {keyword:<{CRACK_MAX_PERIOD}} (fitness {fitness:.3f})")
+
+    best_keyword = ranking[0][0]
+    print(f"\n  Most likely keyword: {best_keyword}")
+    print(f"  Decrypted: {vigenere_decrypt(ciphertext, best_keyword)}\n")
+
+def run_crib_drag_mode():
+    """Handles the user interaction for dragging a probable word across the ciphertext."""
+    print("\n--- CRIB DRAG (PROBABLE WORD) ---")
+    ciphertext = input("  Enter Ciphertext: ")
+    crib = input("  Enter a word likely to appear in the plaintext (e.g., ATTACK): ")
+
+    try:
+        results = vigenere_crib_drag(ciphertext, crib, top_k=5)
+    except ValueError as e:
+        print(f"\n  Error: {e}\n")
+        return
+    if not results:
+        print("\n  The ciphertext is shorter than the crib.\n")
+        return
+
+    print("\n--- MOST LIKELY POSITIONS ---")
+    for offset, key_fragment, score in results:
+        print(f"  Offset {offset:6}: implied key {key_fragment} (score {score:.3f})")
+    print("\n  A repeating implied key reveals the keyword (rotated to the offset's keyword position).\n")
+
 def run_cryptanalysis_note():
     """Provides a note on Vigenère cryptanalysis (Kasiski/Frequency Analysis)."""
     print("\n--- CRYPTANALYSIS NOTE ---")
@@ -130,6 +938,62 @@ def run_cryptanalysis_note():
     print("  2. **Frequency Analysis**: Once the keyword length ($N$) is known, the ciphertext is broken into $N$ separate Caesar Ciphers. Each can then be easily solved using standard frequency analysis (e.g., finding the shift that makes 'E' the most frequent letter).")
     print("\n  This makes Vigenère much stronger than Caesar but still breakable with enough ciphertext.\n")
 
+# --- Pipe Mode ---
+
+def run_crack_mode(args):
+    """Non-interactive keyword recovery: writes the decryption, with the ranking on stderr."""
+    with open_text_stream(args.input, 'r') as source:
+        ciphertext = source.read()
+
+    start = time.perf_counter()
+    ranking = vigenere_crack(ciphertext, workers=args.workers)
+    elapsed = time.perf_counter() - start
+    if not ranking:
+        sys.exit("  Error: the input has too few letters, so there is nothing to analyze.")
+
+    for keyword, fitness, period in ranking:
+        print(f"  Period {period:2}: {keyword} (fitness {fitness:.3f})", file=sys.stderr)
+    print(f"  Most likely keyword: {ranking[0][0]} (cracked in {elapsed:.3f}s)", file=sys.stderr)
+
+    with open_text_stream(args.output, 'w') as sink:
+        sink.write(vigenere_decrypt(ciphertext, ranking[0][0]))
+
+def run_stream_mode(argv):
+    """Non-interactive entry point: streams a file or stdin through the cipher, or cracks it."""
+    parser = argparse.ArgumentParser(description="Vigenère Cipher pipe mode (files or stdin/stdout).")
+    parser.add_argument('mode', choices=['encrypt', 'decrypt', 'crack'])
+    parser.add_argument('keyword', nargs='?', help="Alphabetic keyword, e.g. SECRET; not used by crack")
+    parser.add_argument('-i', '--input', default='-', help="Input file (default: stdin)")
+    parser.add_argument('-o', '--output', default='-', help="Output file (default: stdout)")
+    parser.add_argument('--chunk-size', type=int, default=STREAM_CHUNK_SIZE, help="Characters read per chunk")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help="crack: worker processes for the candidate periods (default: all cores)")
+    args = parser.parse_args(argv)
+
+    if args.workers < 1:
+        parser.error("--workers must be a positive integer")
+    if args.mode == 'crack':
+        run_crack_mode(args)
+        return
+
+    if args.keyword is None:
+        parser.error(f"{args.mode} requires a keyword")
+    if args.chunk_size < 1:
+        parser.error("--chunk-size must be a positive integer")
+    try:
+        compile_keyword(args.keyword)
+    except ValueError as e:
+        parser.error(str(e))
+
+    start = time.perf_counter()
+    with open_text_stream(args.input, 'r') as source, open_text_stream(args.output, 'w') as sink:
+        processed = vigenere_stream(source, sink, args.keyword, args.mode, args.chunk_size)
+    elapsed = time.perf_counter() - start
+
+    # Report on stderr so that stdout stays clean for piping
+    throughput = processed / elapsed / 1e6 if elapsed > 0 else float('inf')
+    print(f"  Processed {processed / 1e6:.2f}M characters in {elapsed:.3f}s ({throughput:.2f}M chars/s)", file=sys.stderr)
+
 # --- Main Program Loop ---
 
 def main_menu():
@@ -140,26 +1004,39 @@ def main_menu():
         print("=" * 60)
         print("  1. Encrypt Message")
         print("  2. Decrypt Message (Requires Keyword)")
-        print("  3. Cryptanalysis Note")
-        print("  4. Exit")
+        print("  3. Kasiski Examination (Find Keyword Length)")
+        print("  4. Crack Keyword (Ciphertext Only)")
+        print("  5. Crib Drag (Probable Word)")
+        print("  6. Cryptanalysis Note")
+        print("  7. Exit")
         print("-" * 60)
         
-        choice = input("  Select an option (1-4): ")
+        choice = input("  Select an option (1-7): ")
         
         if choice == '1':
             run_encryption_mode()
         elif choice == '2':
             run_decryption_mode()
         elif choice == '3':
-            run_cryptanalysis_note()
+            run_kasiski_mode()
         elif choice == '4':
+            run_crack_keyword_mode()
+        elif choice == '5':
+            run_crib_drag_mode()
+        elif choice == '6':
+            run_cryptanalysis_note()
+        elif choice == '7':
             print("\nExiting the program. Goodbye! 👋")
             sys.exit(0)
         else:
-            print("\n  Invalid choice. Please select an option between 1 and 4.")
+            print("\n  Invalid choice. Please select an option between 1 and 7.")
             
         print("=" * 60)
 
 # Standard Python idiom to run the main function
 if __name__ == '__main__':
-    main_menu()
\ No newline at end of file
+    # Any command-line arguments select the non-interactive pipe mode
+    if len(sys.argv) > 1:
+        run_stream_mode(sys.argv[1:])
+    else:
+        main_menu()
\ No newline at end of file
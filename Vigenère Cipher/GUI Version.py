@@ -2,6 +2,8 @@ import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox
 import string
 import sys
+import threading
+import queue
 
 # --- 📚 VIGENÈRE CIPHER LOGIC AND CONSTANTS ---
 
@@ -73,6 +75,79 @@ def vigenere_process_text(text, keyword, mode='encrypt'):
             
     return ''.join(processed_text)
 
+# --- Chunked Processing ---
+
+PROCESS_CHUNK_SIZE = 1 << 16 # Characters transformed per step of the background worker
+
+class VigenereStream:
+    """
+    Stateful Vigenère transform for text handed over in chunks. The keyword position
+    is carried between feed() calls, so the concatenated output is identical to one
+    vigenere_process_text call on the whole text.
+    """
+
+    def __init__(self, keyword, mode='encrypt'):
+        keyword = ''.join(c.upper() for c in keyword if c.isalpha())
+        shifts = [get_char_index(c) for c in keyword]
+        if not shifts:
+            raise ValueError("Keyword must contain at least one alphabetic character.")
+        if None in shifts:
+            raise ValueError("Keyword must only contain the letters A-Z.")
+        self.shifts = shifts if mode == 'encrypt' else [-shift for shift in shifts]
+        self.key_offset = 0 # Position within the keyword of the next alphabetic character
+
+    def feed(self, chunk):
+        """Encrypts or decrypts the next chunk of text and returns the result."""
+        shifts = self.shifts
+        key_offset = self.key_offset
+        processed_text = []
+        for char in chunk:
+            if char.isalpha():
+                char_index = get_char_index(char)
+                if char_index is not None:
+                    char = get_index_char(char_index + shifts[key_offset], char.isupper())
+                key_offset = (key_offset + 1) % len(shifts)
+            processed_text.append(char)
+        self.key_offset = key_offset
+        return ''.join(processed_text)
+
+def vigenere_chunk_steps(text, stream, chunk_size=PROCESS_CHUNK_SIZE):
+    """
+    Generator that transforms the text chunk by chunk through a VigenereStream,
+    yielding (output_chunk, characters_done, total_characters) after each one.
+    """
+    for start in range(0, len(text), chunk_size):
+        chunk = text[start:start + chunk_size]
+        yield stream.feed(chunk), start + len(chunk), len(text)
+
+class BackgroundJob:
+    """
+    Runs a step generator on a worker thread. Progress, the final result or an error
+    are posted to a queue that the Tk thread drains with after() polling; setting
+    the cancel event stops the worker at the next step.
+    """
+    def __init__(self, steps):
+        self.steps = steps
+        self.messages = queue.Queue()
+        self.cancel_event = threading.Event()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        self.thread.start()
+
+    def cancel(self):
+        self.cancel_event.set()
+
+    def _run(self):
+        try:
+            while not self.cancel_event.is_set():
+                self.messages.put(('progress', next(self.steps)))
+            self.messages.put(('cancelled', None))
+        except StopIteration as stop:
+            self.messages.put(('done', stop.value))
+        except Exception as e:
+            self.messages.put(('error', e))
+
 # --- 🖥️ TKINTER GUI APPLICATION (DARK MODE) ---
 
 class VigenereCipherApp(tk.Tk):
@@ -84,6 +159,12 @@ class VigenereCipherApp(tk.Tk):
     TEXT_AREA_BG = '#3a3a3a'
     TEXT_AREA_FG = '#e0e0e0'
     BUTTON_BG = '#4f4f4f'
+
+    # How often (ms) the Tk thread drains the background worker's output
+    POLL_INTERVAL_MS = 50
+
+    # Output chunks inserted into the widget per poll, keeping each Tk update short
+    CHUNKS_PER_POLL = 4
     
     def __init__(self):
         super().__init__()
@@ -92,6 +173,9 @@ class VigenereCipherApp(tk.Tk):
         
         # Setup visual styling
         self._setup_style()
+
+        # Running encrypt/decrypt job (None when idle)
+        self.job = None
         
         # Main container for the single tab
         self.notebook = ttk.Notebook(self)
@@ -174,8 +258,14 @@ class VigenereCipherApp(tk.Tk):
         button_frame = ttk.Frame(tab)
         button_frame.grid(row=2, column=0, columnspan=2, pady=10)
         
-        ttk.Button(button_frame, text="ENCRYPT >>", command=lambda: self._handle_process('encrypt')).pack(side=tk.LEFT, padx=20)
-        ttk.Button(button_frame, text="<< DECRYPT", command=lambda: self._handle_process('decrypt')).pack(side=tk.LEFT, padx=20)
+        self.encrypt_button = ttk.Button(button_frame, text="ENCRYPT >>", command=lambda: self._handle_process('encrypt'))
+        self.encrypt_button.pack(side=tk.LEFT, padx=20)
+        self.decrypt_button = ttk.Button(button_frame, text="<< DECRYPT", command=lambda: self._handle_process('decrypt'))
+        self.decrypt_button.pack(side=tk.LEFT, padx=20)
+        self.cancel_button = ttk.Button(button_frame, text="CANCEL", command=self._cancel_process, state='disabled')
+        self.cancel_button.pack(side=tk.LEFT, padx=20)
+        self.progress = ttk.Progressbar(button_frame, orient=tk.HORIZONTAL, length=150, mode='determinate')
+        self.progress.pack(side=tk.LEFT, padx=10)
 
         # 4. Output Text Area
         ttk.Label(tab, text="Output Result:").grid(row=3, column=0, padx=5, pady=5, sticky="nw")
@@ -202,8 +292,19 @@ class VigenereCipherApp(tk.Tk):
         error_text = text if is_error else ""
         self.status_label.config(text=error_text, foreground=('#ff4444' if is_error else self.BG_DARK))
 
+    def _set_status(self, text, is_error=False):
+        """Shows a message in the status label (errors in red)."""
+        self.status_label.config(text=text, foreground=('#ff4444' if is_error else self.FG_LIGHT))
+
     def _handle_process(self, mode):
-        """Handler for Encrypt/Decrypt buttons."""
+        """
+        Handler for Encrypt/Decrypt buttons. The text is transformed on a worker thread
+        and streamed into the output widget chunk by chunk, so large inputs never block
+        the window.
+        """
+        if self.job is not None:
+            return
+
         keyword = self.keyword_entry.get().strip()
         text = self.input_text_area.get('1.0', tk.END).strip()
         
@@ -218,16 +319,62 @@ class VigenereCipherApp(tk.Tk):
             return
 
         try:
-            # Process the text using Vigenère logic
-            result_text = vigenere_process_text(text, clean_keyword, mode)
-
-            # Display Result
-            self._update_output(self.output_text_area, result_text, is_error=False)
-
+            # Validates the keyword up front; the worker then only transforms text
+            stream = VigenereStream(clean_keyword, mode)
         except ValueError as e:
             self._update_output(self.output_text_area, str(e), is_error=True)
-        except Exception as e:
-            self._update_output(self.output_text_area, f"An unexpected error occurred: {e}", is_error=True)
+            return
+
+        self._update_output(self.output_text_area, "", is_error=False)
+        self._set_status(f"Processing ({mode})...")
+        self.encrypt_button.config(state='disabled')
+        self.decrypt_button.config(state='disabled')
+        self.cancel_button.config(state='normal')
+        self.progress.config(value=0, maximum=len(text))
+
+        self.job = BackgroundJob(vigenere_chunk_steps(text, stream))
+        self.job.start()
+        self.after(self.POLL_INTERVAL_MS, self._poll_process, self.job)
+
+    def _poll_process(self, job):
+        """Moves a few finished chunks from the worker into the output widget, then reschedules."""
+        for _ in range(self.CHUNKS_PER_POLL):
+            try:
+                kind, payload = job.messages.get_nowait()
+            except queue.Empty:
+                break
+
+            if kind == 'progress':
+                output_chunk, done, total = payload
+                self.output_text_area.config(state='normal')
+                self.output_text_area.insert(tk.END, output_chunk)
+                self.output_text_area.config(state='disabled')
+                self.progress.config(value=done, maximum=total)
+                continue
+
+            if kind == 'done':
+                self._set_status("")
+            elif kind == 'cancelled':
+                self._set_status("Processing cancelled; the output is incomplete.", is_error=True)
+            else:
+                self._set_status(f"An unexpected error occurred: {payload}", is_error=True)
+            self._finish_process()
+            return
+
+        self.after(self.POLL_INTERVAL_MS, self._poll_process, job)
+
+    def _finish_process(self):
+        """Restores the buttons once the worker has finished or stopped."""
+        self.job = None
+        self.encrypt_button.config(state='normal')
+        self.decrypt_button.config(state='normal')
+        self.cancel_button.config(state='disabled')
+        self.output_text_area.yview_moveto(0)
+
+    def _cancel_process(self):
+        """Handler for the Cancel button: asks the running worker to stop."""
+        if self.job is not None:
+            self.job.cancel()
 
 
 if __name__ == "__main__":